@@ -0,0 +1,181 @@
+# -*- coding: utf-8 -*-
+# code: language=python tabSize=4
+#
+import json
+import time
+import webbrowser
+from pathlib import Path
+from typing import Dict, Iterator, List, Tuple
+
+import docker
+from git import Repo
+
+LogLine = Tuple[float, str]
+RecordingKey = Tuple[str, Tuple[str, ...]]
+
+# Container log streams as (seconds since previous line, line), plus the time taken to
+# clone and to stop a container. The bundled file is a sample; record real ones with
+# python -m runradarrun.harness --record
+DEFAULT_RECORDINGS = Path(__file__).with_name("recordings.json")
+
+
+def load_recordings(path: Path) -> dict:
+    with open(path) as f:
+        data = json.load(f)
+    return dict(
+        recordings={(c["image"], tuple(c["command"])): [(delay, line) for delay, line in c["log"]] for c in data["containers"]},
+        clone_delay=data["clone"],
+        stop_delay=data["stop"],
+    )
+
+
+def dump_recordings(path: Path, containers: List[dict], clone: float, stop: float) -> None:
+    # one log line per line of JSON, so recordings stay readable and diffable
+    def container(c):
+        log = ",\n".join(f"        {json.dumps(list(line))}" for line in c["log"])
+        return f'    {{\n      "image": {json.dumps(c["image"])},\n      "command": {json.dumps(list(c["command"]))},\n      "log": [\n{log}\n      ]\n    }}'
+
+    with open(path, "w") as f:
+        f.write(f'{{\n  "clone": {round(clone, 3)},\n  "stop": {round(stop, 3)},\n  "containers": [\n')
+        f.write(",\n".join(container(c) for c in containers))
+        f.write("\n  ]\n}\n")
+
+
+class Backend:
+    def __init__(self) -> None:
+        self._client = None
+
+    @property
+    def client(self):
+        if self._client is None:
+            self._client = docker.from_env()
+        return self._client
+
+    def run_container(self, image: str, **kwargs):
+        return self.client.containers.run(image, **kwargs)
+
+    def clone(self, url: str, path: Path, **kwargs) -> None:
+        Repo.clone_from(url, path, **kwargs)
+
+    def open_browser(self, url: str) -> None:
+        webbrowser.open(url, new=1)
+
+
+class RecordingContainer:
+    def __init__(self, backend: "RecordingBackend", container, log: List[LogLine]) -> None:
+        self.backend = backend
+        self.container = container
+        self.log = log
+        self._last = time.perf_counter()
+
+    def logs(self, stream: bool = False) -> Iterator[bytes]:
+        pending = ""
+        for chunk in self.container.logs(stream=stream):
+            now = time.perf_counter()
+            *lines, pending = (pending + chunk.decode("utf-8", errors="replace")).split("\n")
+            for line in lines:
+                self.log.append((round(now - self._last, 3), line.rstrip("\r")))
+                self._last = now
+            yield chunk
+            if self.backend.stop_on and any(self.backend.stop_on in line for line in lines):
+                return
+
+    def stop(self) -> None:
+        start = time.perf_counter()
+        self.container.stop()
+        self.backend.stop_delay = time.perf_counter() - start
+
+
+class RecordingBackend(Backend):
+    def __init__(self, stop_on: str | None = None) -> None:
+        super().__init__()
+        self.stop_on = stop_on
+        self.containers: List[dict] = []
+        self.clone_delay = 0.0
+        self.stop_delay = 0.0
+
+    def run_container(self, image: str, **kwargs):
+        entry = dict(image=image, command=list(kwargs.get("command") or ()), log=[])
+        self.containers.append(entry)
+        return RecordingContainer(self, super().run_container(image, **kwargs), entry["log"])
+
+    def clone(self, url: str, path: Path, **kwargs) -> None:
+        start = time.perf_counter()
+        super().clone(url, path, **kwargs)
+        self.clone_delay = time.perf_counter() - start
+
+    def save(self, path: Path) -> None:
+        dump_recordings(path, self.containers, self.clone_delay, self.stop_delay)
+
+
+class FakeContainer:
+    def __init__(self, backend: "FakeBackend", image: str, log: List[LogLine], kwargs: dict) -> None:
+        self.backend = backend
+        self.image = image
+        self.log = log
+        self.kwargs = kwargs
+        self.stopped = False
+
+    def logs(self, stream: bool = False):
+        for delay, line in self.log:
+            if self.stopped:
+                return
+            self.backend.sleep(delay)
+            self.backend.event("log", line)
+            yield (line + "\n").encode("utf-8")
+
+    def stop(self) -> None:
+        self.backend.sleep(self.backend.stop_delay)
+        self.stopped = True
+        self.backend.event("stop", self.image)
+
+
+class FakeBackend(Backend):
+    def __init__(
+        self,
+        recordings: Dict[RecordingKey, List[LogLine]] | None = None,
+        speed: float = 1.0,
+        clone_delay: float | None = None,
+        stop_delay: float | None = None,
+    ) -> None:
+        super().__init__()
+        if recordings is None:
+            default = load_recordings(DEFAULT_RECORDINGS)
+            recordings = default["recordings"]
+            clone_delay = default["clone_delay"] if clone_delay is None else clone_delay
+            stop_delay = default["stop_delay"] if stop_delay is None else stop_delay
+        self.recordings = recordings
+        self.speed = speed
+        self.clone_delay = clone_delay or 0.0
+        self.stop_delay = stop_delay or 0.0
+        self.events: List[Tuple[float, str, str]] = []
+        self.containers: List[FakeContainer] = []
+
+    @classmethod
+    def from_file(cls, path: Path, speed: float = 1.0) -> "FakeBackend":
+        return cls(speed=speed, **load_recordings(path))
+
+    def sleep(self, seconds: float) -> None:
+        if seconds > 0 and self.speed > 0:
+            time.sleep(seconds / self.speed)
+
+    def event(self, kind: str, detail: str = "") -> None:
+        self.events.append((time.perf_counter(), kind, detail))
+
+    def first(self, kind: str, contains: str = "") -> float | None:
+        return next((t for t, k, detail in self.events if k == kind and contains in detail), None)
+
+    def run_container(self, image: str, **kwargs):
+        key = (image, tuple(kwargs.get("command") or ()))
+        container = FakeContainer(self, image, self.recordings.get(key, []), kwargs)
+        self.containers.append(container)
+        self.event("run", image)
+        return container
+
+    def clone(self, url: str, path: Path, **kwargs) -> None:
+        self.sleep(self.clone_delay)
+        (Path(path) / "docs").mkdir(parents=True)
+        self.event("clone", url)
+
+    def open_browser(self, url: str) -> None:
+        self.event("browser", url)
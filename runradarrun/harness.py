@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+# code: language=python tabSize=4
+#
+import argparse
+import contextlib
+import os
+import pathlib
+import statistics
+import time
+from dataclasses import dataclass
+from typing import List
+
+from .backend import DEFAULT_RECORDINGS, FakeBackend, RecordingBackend
+from .ingest import Ingester
+from .main import load_publishers
+from .model import AbstractPublisher, Radar
+
+
+@dataclass
+class Timings:
+    publisher: str
+    ready: float
+    browser: float
+    cleanup: float
+
+
+def measure(publisher_class: type[AbstractPublisher], radar: Radar, backend: FakeBackend, options: argparse.Namespace) -> Timings:
+    publisher = publisher_class(radar, options=options, backend=backend)
+    start = time.perf_counter()
+    try:
+        publisher.run()
+    finally:
+        cleanup_start = time.perf_counter()
+        publisher.cleanup()
+        cleanup_end = time.perf_counter()
+
+    ready = backend.first("log", publisher.ready_line)
+    browser = backend.first("browser")
+    return Timings(
+        publisher=publisher_class.cli_id(),
+        ready=ready - start if ready is not None else float("nan"),
+        browser=browser - start if browser is not None else float("nan"),
+        cleanup=cleanup_end - cleanup_start,
+    )
+
+
+def record(publisher_class: type[AbstractPublisher], radar: Radar, path: pathlib.Path, options: argparse.Namespace) -> None:
+    # stops reading the logs once the publisher is ready, then stops the container
+    backend = RecordingBackend(stop_on=publisher_class.ready_line)
+    publisher = publisher_class(radar, options=options, backend=backend)
+    try:
+        publisher.run()
+    finally:
+        publisher.cleanup()
+    backend.save(path)
+
+
+def summarize(runs: List[Timings]) -> str:
+    def stat(values):
+        return f"{statistics.median(values):8.3f}s" + (f" ±{statistics.stdev(values):.3f}" if len(values) > 1 else "")
+
+    ready = stat([r.ready for r in runs])
+    browser = stat([r.browser for r in runs])
+    cleanup = stat([r.cleanup for r in runs])
+    return f"{runs[0].publisher:>10}: ready {ready}  browser {browser}  cleanup {cleanup}"
+
+
+def main():
+    publishers = load_publishers()
+
+    parser = argparse.ArgumentParser(description="measure publisher run latencies against a fake container backend")
+    parser.add_argument(
+        "--publisher",
+        "-P",
+        action="append",
+        choices=sorted(publishers.keys()),
+        help="publisher to measure, may be repeated (default: all)",
+    )
+    parser.add_argument(
+        "--speed",
+        "-s",
+        type=float,
+        default=1.0,
+        help="replay speed of the recorded container logs, 0 replays instantly",
+    )
+    parser.add_argument(
+        "--repeat",
+        "-n",
+        type=int,
+        default=3,
+        help="number of runs per publisher",
+    )
+    parser.add_argument(
+        "--recordings",
+        type=pathlib.Path,
+        default=DEFAULT_RECORDINGS,
+        help="recorded container logs to replay (default: a bundled sample)",
+    )
+    parser.add_argument(
+        "--record",
+        type=pathlib.Path,
+        metavar="FILE",
+        help="run the publisher once against Docker and record its container logs to FILE",
+    )
+    parser.add_argument(
+        "input",
+        type=pathlib.Path,
+        nargs="?",
+        default="./radar",
+        help="radar definition directory",
+    )
+    args = parser.parse_args()
+
+    options = argparse.Namespace(quiet=True, run_only=False, live=False, cache_dir=None)
+    radar = Ingester(args.input, options=options).ingest()
+
+    if args.record:
+        if not args.publisher or len(args.publisher) != 1:
+            parser.error("--record needs exactly one --publisher")
+        publisher_class = publishers[args.publisher[0]]
+        record(publisher_class, radar, args.record, argparse.Namespace(**{**vars(options), "run_only": True}))
+        return
+
+    with open(os.devnull, "w") as devnull:
+        for cli_id in args.publisher or sorted(publishers.keys()):
+            runs = []
+            for _ in range(args.repeat):
+                with contextlib.redirect_stdout(devnull):
+                    runs.append(measure(publishers[cli_id], radar, FakeBackend.from_file(args.recordings, speed=args.speed), options))
+            print(summarize(runs))
+
+
+if __name__ == "__main__":
+    main()
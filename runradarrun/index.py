@@ -0,0 +1,187 @@
+# -*- coding: utf-8 -*-
+# code: language=python tabSize=4
+#
+import json
+import math
+import re
+import unicodedata
+from bisect import bisect_left, bisect_right
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from itertools import chain
+from typing import Dict, Iterable, List, Set, Tuple
+
+from .model import Blip
+from .output import github_annotation
+
+_separators = re.compile(r"[\W_]+")
+_parenthesized = re.compile(r"\(([^)]*)\)")
+_eps = 1e-9
+
+# an abbreviation carried by more blips than this is a shared qualifier, such as "(beta)"
+MAX_ALIAS_BLIPS = 3
+
+
+def normalize_name(name: str) -> str:
+    if not name.isascii():
+        name = "".join(c for c in unicodedata.normalize("NFKD", name) if not unicodedata.combining(c))
+    return " ".join(w for w in _separators.split(name.casefold()) if w)
+
+
+def name_key(name: str) -> str:
+    return normalize_name(name).replace(" ", "")
+
+
+def trigrams(text: str) -> Set[str]:
+    padded = f" {text} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+def blip_keys(blip: Blip) -> Set[str]:
+    names = [blip.name]
+    if "(" in blip.name:
+        names.append(_parenthesized.sub(" ", blip.name))
+    if blip.source is not None:
+        names.append(blip.source.stem)
+    return {key for key in map(name_key, names) if key}
+
+
+def blip_aliases(blip: Blip) -> Set[str]:
+    return {key for key in map(name_key, _parenthesized.findall(blip.name)) if key} - blip_keys(blip)
+
+
+def blip_location(blip: Blip) -> str:
+    if blip.source is not None:
+        return blip.source.as_posix()
+    return f"{blip.quadrant}/{blip.ring}"
+
+
+@dataclass
+class Duplicate:
+    score: float
+    first: Blip
+    second: Blip
+
+    def __str__(self) -> str:
+        return f"{self.score:.2f}  {self.first.name} ({blip_location(self.first)})  ~  {self.second.name} ({blip_location(self.second)})"
+
+
+class NameIndex:
+    def __init__(self, blips: Iterable[Blip]) -> None:
+        self.blips: List[Blip] = list(blips)
+        self.keys: Dict[str, List[int]] = defaultdict(list)
+        self.aliases: Dict[str, List[int]] = defaultdict(list)
+        self.names: Dict[str, List[int]] = defaultdict(list)
+
+        for pos, blip in enumerate(self.blips):
+            for key in blip_keys(blip):
+                self.keys[key].append(pos)
+            for key in blip_aliases(blip):
+                self.aliases[key].append(pos)
+            self.names[normalize_name(blip.name)].append(pos)
+
+    def lookup(self, name: str) -> List[Blip]:
+        return [self.blips[pos] for pos in self.keys.get(name_key(name), []) + self.aliases.get(name_key(name), [])]
+
+    def exact_pairs(self) -> Set[Tuple[int, int]]:
+        # Full names and file stems match each other; an abbreviation only matches
+        # another blip's full name or file stem, never another abbreviation.
+        pairs = set()
+        for positions in self.keys.values():
+            for i, first in enumerate(positions):
+                for second in positions[i + 1 :]:
+                    pairs.add((first, second))
+        for key, positions in self.aliases.items():
+            if len(positions) > MAX_ALIAS_BLIPS:
+                continue
+            for first in positions:
+                for second in self.keys.get(key, []):
+                    if first != second:
+                        pairs.add((min(first, second), max(first, second)))
+        return pairs
+
+    def similar_pairs(self, threshold: float) -> Dict[Tuple[int, int], float]:
+        # Prefix filtering: trigrams are ranked rarest first, and any pair reaching
+        # the threshold shares at least two trigrams within the first
+        # |x| - overlap + 2 of each sorted list, where overlap is the least
+        # overlap the threshold allows. Names are probed by increasing size, and
+        # postings are kept per trigram in the same order, so the minimum partner
+        # size is a single bisect and candidates come out of C-level set
+        # operations. Pairs of tiny names that reach the threshold with a single
+        # shared trigram are picked up separately.
+        # Blips with the same normalized name are compared once, as one entry.
+        names = list(self.names)
+        grams = [trigrams(name) for name in names]
+        frequency = Counter(chain.from_iterable(grams))
+        rank = {gram: r for r, gram in enumerate(sorted(frequency, key=lambda g: (frequency[g], g)))}
+        tokens = [sorted(map(rank.__getitem__, name_grams)) for name_grams in grams]
+        token_sets = [frozenset(name_tokens) for name_tokens in tokens]
+        sizes = [len(name_tokens) for name_tokens in tokens]
+
+        postings: Dict[int, Tuple[List[int], List[int]]] = {}
+        pairs = {}
+
+        for pos in sorted(range(len(names)), key=sizes.__getitem__):
+            size = sizes[pos]
+            min_size = threshold * size / (2 - threshold) - _eps
+            single_max_size = 2 / threshold - size + _eps
+
+            seen = set()
+            candidates = set()
+            for token in tokens[pos][: size - math.ceil(min_size) + 2]:
+                if token in postings:
+                    ids, id_sizes = postings[token]
+                    start = bisect_left(id_sizes, min_size)
+                    found = ids[start:]
+                    candidates |= seen.intersection(found)
+                    seen.update(found)
+                    if single_max_size >= 1:
+                        candidates.update(ids[start : bisect_right(id_sizes, single_max_size)])
+
+            name_tokens = token_sets[pos]
+            for other in candidates:
+                score = 2 * len(name_tokens & token_sets[other]) / (size + sizes[other])
+                if score >= threshold - _eps:
+                    for first in self.names[names[other]]:
+                        for second in self.names[names[pos]]:
+                            pairs[(min(first, second), max(first, second))] = score
+
+            # partners probed later are at least as large, so a shorter prefix is enough
+            for token in tokens[pos][: size - math.ceil(threshold * size - _eps) + 2]:
+                ids, id_sizes = postings.setdefault(token, ([], []))
+                ids.append(pos)
+                id_sizes.append(size)
+
+        return pairs
+
+    def duplicates(self, threshold: float = 0.8) -> List[Duplicate]:
+        scores = self.similar_pairs(threshold)
+        scores.update({pair: 1.0 for pair in self.exact_pairs()})
+        return sorted(
+            (Duplicate(score, self.blips[first], self.blips[second]) for (first, second), score in scores.items()),
+            key=lambda d: (-d.score, d.first.name, d.second.name),
+        )
+
+
+def format_duplicates(duplicates: List[Duplicate], fmt: str = "text") -> str:
+    if fmt == "json":
+        return json.dumps(
+            [
+                dict(
+                    score=round(d.score, 4),
+                    first=dict(name=d.first.name, location=blip_location(d.first)),
+                    second=dict(name=d.second.name, location=blip_location(d.second)),
+                )
+                for d in duplicates
+            ]
+        )
+    if fmt == "github":
+        return "\n".join(
+            github_annotation(
+                "warning",
+                f"probable duplicate of '{d.first.name}' in {blip_location(d.first)} (similarity {d.score:.2f})",
+                file=blip_location(d.second),
+            )
+            for d in duplicates
+        )
+    return "\n".join(str(d) for d in duplicates)
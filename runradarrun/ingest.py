@@ -29,15 +29,17 @@ class Ingester:
                 blip.previous_ring = None if blip_spec["blip"]["is_new"] else blip.ring
             else:
                 blip.previous_ring = blip.ring
+            blip.source = path
             return blip
 
-    def ingest(self) -> Radar:
+    @property
+    def specs_file(self) -> Path:
         if (self.radar_path / "specs.yml").exists():
-            file = self.radar_path / "specs.yml"
-        else:
-            file = self.radar_path / "specs.yaml"
+            return self.radar_path / "specs.yml"
+        return self.radar_path / "specs.yaml"
 
-        with open(file) as f:
+    def ingest(self) -> Radar:
+        with open(self.specs_file) as f:
             specs = yaml.safe_load(f)
 
         rings = {pos: Ring(**r) for pos, r in specs["rings"].items()}
@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+# code: language=python tabSize=4
+#
+import json
+import queue
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Callable, Dict, List
+
+client_snippet = """\
+<script>
+(function() {
+  var source = new EventSource('%(url)s');
+  source.addEventListener('diff', function(event) {
+    var diff = JSON.parse(event.data);
+    var key = '%(key)s';
+    var removed = new Set(diff.removed.concat(diff.changed.map(function(e) { return e[key]; })));
+    var entries = window.radarEntries.filter(function(e) { return !removed.has(e[key]); });
+    window.radarEntries.length = 0;
+    Array.prototype.push.apply(window.radarEntries, entries.concat(diff.changed, diff.added));
+    window.radarRender();
+  });
+})();
+</script>
+"""
+
+reload_snippet = "<script>new EventSource('%(url)s').addEventListener('diff', function() { location.reload(); });</script>"
+
+
+def diff_entries(old: List[dict], new: List[dict], key: str) -> Dict[str, list]:
+    old_by_key = {entry[key]: entry for entry in old}
+    new_by_key = {entry[key]: entry for entry in new}
+
+    return dict(
+        added=[entry for k, entry in new_by_key.items() if k not in old_by_key],
+        removed=[k for k in old_by_key if k not in new_by_key],
+        changed=[entry for k, entry in new_by_key.items() if k in old_by_key and old_by_key[k] != entry],
+    )
+
+
+def is_empty_diff(diff: Dict[str, list]) -> bool:
+    return not any(diff.values())
+
+
+class LiveServer:
+    host = "localhost"
+    port = 8081
+    keepalive = 15.0
+
+    def __init__(self, origin: str = "http://localhost:8080") -> None:
+        # only the page served by the publisher may subscribe to the radar diffs
+        self.origin = origin
+        self._clients: List[queue.Queue] = []
+        self._lock = threading.Lock()
+        self._server = None
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}/events"
+
+    def snippet(self, key: str) -> str:
+        return client_snippet % dict(url=self.url, key=key)
+
+    def reload_snippet(self) -> str:
+        return reload_snippet % dict(url=self.url)
+
+    def publish(self, diff: Dict[str, list]) -> None:
+        message = f"event: diff\ndata: {json.dumps(diff)}\n\n".encode("utf-8")
+        with self._lock:
+            for client in self._clients:
+                client.put(message)
+
+    def _subscribe(self) -> queue.Queue:
+        client = queue.Queue()
+        with self._lock:
+            self._clients.append(client)
+        return client
+
+    def _unsubscribe(self, client: queue.Queue) -> None:
+        with self._lock:
+            self._clients.remove(client)
+
+    def _handler(self):
+        live = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path != "/events":
+                    self.send_error(404)
+                    return
+                if self.headers.get("Origin", live.origin) != live.origin:
+                    self.send_error(403)
+                    return
+
+                client = live._subscribe()
+                try:
+                    self.send_response(200)
+                    self.send_header("Content-Type", "text/event-stream")
+                    self.send_header("Cache-Control", "no-cache")
+                    self.send_header("Access-Control-Allow-Origin", live.origin)
+                    self.end_headers()
+
+                    while True:
+                        try:
+                            message = client.get(timeout=live.keepalive)
+                        except queue.Empty:
+                            message = b": keepalive\n\n"
+                        if message is None:
+                            break
+                        self.wfile.write(message)
+                        self.wfile.flush()
+                except (BrokenPipeError, ConnectionResetError):
+                    pass
+                finally:
+                    live._unsubscribe(client)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def start(self) -> None:
+        self._server = ThreadingHTTPServer((self.host, self.port), self._handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        if self._server:
+            with self._lock:
+                for client in self._clients:
+                    client.put(None)
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+
+class RadarWatcher:
+    interval = 1.0
+
+    def __init__(self, path: Path, callback: Callable[[], None], on_error: Callable[[Exception], None] | None = None) -> None:
+        self.path = path
+        self.callback = callback
+        self.on_error = on_error
+        self._stop = threading.Event()
+        self._thread = None
+        self._snapshot = self.snapshot()
+
+    def snapshot(self) -> Dict[str, tuple]:
+        result = {}
+        for file in self.path.rglob("*"):
+            try:
+                if file.is_file():
+                    stat = file.stat()
+                    result[file.as_posix()] = (stat.st_mtime_ns, stat.st_size)
+            except OSError:
+                # editors create and remove swap files all the time
+                continue
+        return result
+
+    def poll(self) -> bool:
+        snapshot = self.snapshot()
+        if snapshot == self._snapshot:
+            return False
+        self._snapshot = snapshot
+        self.callback()
+        return True
+
+    def _loop(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.poll()
+            except Exception as e:
+                if self.on_error:
+                    self.on_error(e)
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._loop, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
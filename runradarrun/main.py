@@ -10,11 +10,20 @@ import argparse
 import importlib
 import pathlib
 import pkgutil
+import sys
+from urllib.parse import urlsplit
+
+import yaml
 
 import runradarrun.publishers
+from runradarrun.index import NameIndex, format_duplicates
 from runradarrun.ingest import Ingester
+from runradarrun.live import LiveServer, RadarWatcher, is_empty_diff
 from runradarrun.model import RadarException
 from runradarrun.output import Printer
+from runradarrun.render import default_cache_dir
+from runradarrun.timeline import Timeline
+from runradarrun.validate import Validator, format_diagnostics
 
 
 def iter_namespace(ns_pkg):
@@ -62,6 +71,72 @@ def main():
         help="only run the radar, depends on publisher",
         action="store_true",
     )
+    parser.add_argument(
+        "--shard",
+        help="write a small index plus per-quadrant description shards, with .gz/.br variants, depends on publisher",
+        action="store_true",
+    )
+    parser.add_argument(
+        "--live",
+        "-l",
+        help="with --run, push radar changes to open browsers, depends on publisher",
+        action="store_true",
+    )
+    parser.add_argument(
+        "--validate",
+        "-V",
+        help="validate the radar definition, reporting all problems at once",
+        action="store_true",
+    )
+    parser.add_argument(
+        "--dedupe",
+        "-D",
+        help="report probable duplicate blips, with similarity scores",
+        action="store_true",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.8,
+        help="minimum name similarity (0-1] reported by --dedupe",
+    )
+    parser.add_argument(
+        "--fail-on-duplicates",
+        help="with --dedupe, exit with status 1 when probable duplicates are found",
+        action="store_true",
+    )
+    parser.add_argument(
+        "--format",
+        "-f",
+        default="text",
+        choices=["text", "json", "github"],
+        help="format of the --validate and --dedupe reports",
+    )
+    parser.add_argument(
+        "--timeline",
+        "-T",
+        type=pathlib.Path,
+        help="write the ring history of every blip across radar versions to this file",
+    )
+    parser.add_argument(
+        "--timeline-rev",
+        action="append",
+        metavar="REV",
+        help="git revision of a radar version for --timeline, oldest first (default: all tags by date)",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=pathlib.Path,
+        default=default_cache_dir(),
+        help="directory caching rendered blip descriptions",
+    )
+    parser.add_argument(
+        "--no-cache",
+        dest="cache_dir",
+        action="store_const",
+        const=None,
+        help="do not cache rendered blip descriptions on disk",
+    )
     parser.add_argument(
         "--quiet",
         "-q",
@@ -79,8 +154,28 @@ def main():
     try:
         args = parser.parse_args()
         p = Printer(args.quiet)
+
+        if args.validate:
+            validator = Validator(pathlib.Path(args.input), options=args)
+            diagnostics = validator.validate()
+            if diagnostics:
+                print(format_diagnostics(diagnostics, args.format))
+            return 1 if validator.errors else 0
+
+        if args.timeline:
+            Timeline(pathlib.Path(args.input), revisions=args.timeline_rev, options=args).write(args.timeline)
+            return 0
+
         ingester = Ingester(pathlib.Path(args.input), options=args)
         radar = ingester.ingest()
+
+        if args.dedupe:
+            if not 0 < args.threshold <= 1:
+                raise RadarException(f"Threshold must be greater than 0 and at most 1: {args.threshold}")
+            duplicates = NameIndex(radar.blips).duplicates(args.threshold)
+            if duplicates:
+                print(format_duplicates(duplicates, args.format))
+            return 1 if duplicates and args.fail_on_duplicates else 0
         p.print(f"{p.align_item('Radar Path')}: {p.term.bold_yellow(str(ingester.radar_path.absolute()))}")
         p.print(f"{p.align_item('Rings')}: {', '.join(p.term.bold_green(r.name) for r in radar.rings_raw.values())}")
         p.print(f"{p.align_item('Quadrants')}: {', '.join(p.term.bold_green(q.name) for q in radar.quadrants_raw.values())}")
@@ -93,16 +188,46 @@ def main():
             publisher.write(args.output)
 
         if args.run or args.run_only:
+            live, watcher = None, None
+            if args.live:
+                origin = urlsplit(publisher.url)
+                live = LiveServer(origin=f"{origin.scheme}://{origin.netloc}")
+
+                def report(e):
+                    p.print(f"\n{p.term.bold_red}ERROR: {e}{p.term.normal}")
+
+                def reload():
+                    try:
+                        diff = publisher.refresh(Ingester(ingester.radar_path, options=args).ingest())
+                    except (RadarException, yaml.YAMLError, KeyError, TypeError, ValueError, OSError) as e:
+                        report(e)
+                        return
+                    if not is_empty_diff(diff):
+                        live.publish(diff)
+
+                watcher = RadarWatcher(ingester.radar_path, reload, on_error=report)
+                publisher.live = live
+
             try:
+                if live:
+                    try:
+                        live.start()
+                    except OSError as e:
+                        raise RadarException(f"Cannot start the live update server on {live.host}:{live.port}: {e}")
+                    watcher.start()
                 p.print(f"{p.align_item('Radar URL')}: {p.term.bold_blue}{p.term.link(publisher.url, publisher.url)}{p.term.normal}")
                 publisher.run()
             finally:
+                if watcher:
+                    watcher.stop()
+                    live.stop()
                 publisher.cleanup()
     except KeyboardInterrupt:
         pass
     except RadarException as e:
         print(f"\n{p.term.bold_red}ERROR: {e}{p.term.normal}")
+        return 1
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -2,10 +2,13 @@
 # code: language=python tabSize=4
 #
 import argparse
-import webbrowser
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import TYPE_CHECKING, Dict, List, Tuple
+
+if TYPE_CHECKING:
+    from .backend import Backend
+    from .render import Renderer
 
 OptionalStrOrListStr = str | list[str] | None
 
@@ -44,6 +47,7 @@ class Blip:
         self.description = description or []
         self.references = references or []
         self.tags = tags or []
+        self.source: Path | None = None
 
     @property
     def is_new(self) -> bool:
@@ -69,6 +73,8 @@ class Radar:
     QUADRANTS_TL_BL_TR_BR = (Q_TL, Q_BL, Q_TR, Q_BR)
     QUADRANTS_TL_TR_BL_BR = (Q_TL, Q_TR, Q_BL, Q_BR)
 
+    RINGS_OUTWARD = ("inner", "mid_inner", "mid_outer", "outer")
+
     def __init__(self, rings: Dict[str, Ring], quadrants: Dict[str, Quadrant]) -> None:
         if Radar.MIN_NUM_RINGS <= len(rings) <= Radar.MAX_NUM_RINGS:
             self._rings = rings
@@ -96,10 +102,10 @@ class Radar:
         return self._quadrants
 
     def rings_outward(self) -> List[Ring]:
-        return [self._rings[ring] for ring in ["inner", "mid_inner", "mid_outer", "outer"] if self._rings.get(ring)]
+        return [self._rings[ring] for ring in self.RINGS_OUTWARD if self._rings.get(ring)]
 
     def rings_inward(self) -> List[Ring]:
-        return [self._rings[ring] for ring in ["outer", "mid_outer", "mid_inner", "inner"] if self._rings.get(ring)]
+        return [self._rings[ring] for ring in reversed(self.RINGS_OUTWARD) if self._rings.get(ring)]
 
     def quadrants(self, order: Tuple) -> List[Quadrant]:
         return [self._quadrants[q] for q in order]
@@ -107,11 +113,22 @@ class Radar:
 
 class AbstractPublisher:
     publishing_url = None
+    entry_key = "name"
+
+    def __init__(self, radar: Radar, options: argparse.Namespace | None = None, backend: "Backend | None" = None) -> None:
+        # imported here so that the data model does not pull in docker and git
+        from .backend import Backend
 
-    def __init__(self, radar: Radar, options: argparse.Namespace | None = None) -> None:
         self.radar = radar
         self.options = options
+        self.backend = backend or Backend()
+        self.live = None
+        self.served_output = None
         self._output = None
+        self._renderer = None
+
+    def make_entries(self) -> List[dict]:
+        raise NotImplementedError()
 
     def make_output(self) -> str:
         raise NotImplementedError()
@@ -120,6 +137,23 @@ class AbstractPublisher:
     def cli_id(cls):
         raise NotImplementedError()
 
+    @property
+    def renderer(self) -> "Renderer":
+        from .render import Renderer
+
+        if self._renderer is None:
+            self._renderer = Renderer(cache_dir=getattr(self.options, "cache_dir", None))
+        return self._renderer
+
+    def description_html(self, blip: Blip) -> str:
+        from .render import as_markdown
+
+        parts = (
+            self.renderer.render(as_markdown(blip.description)),
+            self.renderer.render(as_markdown(blip.references, bullets=True)),
+        )
+        return "\n".join(part for part in parts if part)
+
     @property
     def output(self) -> str:
         if self._output is None:
@@ -144,8 +178,23 @@ class AbstractPublisher:
         with open(output, "w") as outputfile:
             outputfile.write(self.output)
 
+    def refresh(self, radar: Radar) -> Dict[str, list]:
+        from .live import diff_entries
+
+        old_radar, old_entries = self.radar, self.make_entries()
+        self.radar = radar
+        try:
+            new_entries = self.make_entries()
+        except Exception:
+            self.radar = old_radar
+            raise
+        self._output = None
+        if self.served_output:
+            self.write(self.served_output)
+        return diff_entries(old_entries, new_entries, self.entry_key)
+
     def open_url(self, url: str | None = None) -> None:
         if not url:
             url = self.url
         if not self.options.run_only:
-            webbrowser.open(url, new=1)
+            self.backend.open_browser(url)
@@ -4,6 +4,20 @@
 from blessed import Terminal
 
 
+def _escape_data(value: str) -> str:
+    return value.replace("%", "%25").replace("\r", "%0D").replace("\n", "%0A")
+
+
+def _escape_property(value: str) -> str:
+    return _escape_data(value).replace(":", "%3A").replace(",", "%2C")
+
+
+def github_annotation(level: str, message: str, **properties) -> str:
+    # a GitHub Actions workflow command, escaped so that any message stays on one line
+    props = ",".join(f"{key}={_escape_property(str(value))}" for key, value in properties.items() if value is not None)
+    return f"::{level}{' ' + props if props else ''}::{_escape_data(message)}"
+
+
 class Printer:
     def __init__(self, quiet) -> None:
         self.quiet = quiet
@@ -1,51 +1,172 @@
 # -*- coding: utf-8 -*-
 # code: language=python tabSize=4
 #
+import gzip
 import json
 import os
 from pathlib import Path
 from tempfile import TemporaryDirectory
 
-import docker
-
 from ..model import AbstractPublisher
 from ..output import Printer
 
+try:
+    import brotli
+except ImportError:  # install the run-radar-run[brotli] extra for .br variants
+    brotli = None
+
+# included in the http block of the container's nginx
+nginx_conf = """\
+gzip_static on;
+"""
+nginx_snippet_conf = """\
+sub_filter '</body>' "%(snippet)s</body>";
+sub_filter_once on;
+"""
+
+# Fills in a blip's description from its quadrant's shard when the blip is opened in the
+# page's blip list, fetching each shard once. It goes into an nginx string, so it must
+# not contain double quotes, backslashes or dollar signs.
+shard_client_snippet = """\
+<script>
+(function() {
+  var shards = {};
+  var index = fetch('%(index)s').then(function(r) { return r.json(); }).then(function(entries) {
+    var byName = {};
+    entries.forEach(function(e) { byName[e.name] = e.shard; });
+    return byName;
+  });
+  function load(shard) {
+    if (!shards[shard]) {
+      shards[shard] = fetch('%(prefix)s' + shard + '%(suffix)s').then(function(r) { return r.json(); });
+    }
+    return shards[shard];
+  }
+  document.addEventListener('click', function(event) {
+    var item = event.target.closest('li');
+    var description = item && item.querySelector('[id^=blip-description-]');
+    var label = item && item.querySelector('.blip-list__item-container__name-value, .blip-list-item');
+    if (!description || !label || description.dataset.loaded) return;
+    var text = label.textContent.trim(), dot = text.indexOf('. ');
+    var name = dot > 0 && !isNaN(text.slice(0, dot)) ? text.slice(dot + 2) : text;
+    index.then(function(byName) { return name in byName ? load(byName[name]) : {}; }).then(function(descriptions) {
+      if (descriptions[name]) {
+        description.innerHTML = descriptions[name];
+        description.dataset.loaded = 'true';
+      }
+    });
+  }, true);
+})();
+</script>
+"""
+
+
+def write_precompressed(path: Path) -> None:
+    data = path.read_bytes()
+    with open(path.with_name(path.name + ".gz"), "wb") as gz_file:
+        gz_file.write(gzip.compress(data, compresslevel=9, mtime=0))
+    if brotli is not None:
+        with open(path.with_name(path.name + ".br"), "wb") as br_file:
+            br_file.write(brotli.compress(data, mode=brotli.MODE_TEXT))
+
 
 class Publisher(AbstractPublisher):
     container_image = "wwwthoughtworks/build-your-own-radar:latest"
     container = None
     publishing_url = "http://localhost:8080/"
     run_output_file = "run-radar-run.json"
+    ready_line = "Starting nginx server..."
 
     @classmethod
     def cli_id(cls):
         return "twbyor"
 
-    def make_output(self):
-        results = []
+    @staticmethod
+    def make_entry(blip, description):
+        return dict(
+            name=blip.name,
+            ring=blip.ring,
+            quadrant=blip.quadrant,
+            isNew="TRUE" if blip.is_new else "FALSE",
+            description=description,
+        )
+
+    def make_entries(self):
+        return [self.make_entry(blip, self.description_html(blip)) for blip in self.radar.blips]
+
+    @property
+    def sharded(self) -> bool:
+        return bool(getattr(self.options, "shard", False))
+
+    def quadrant_ids(self):
+        return {q.name: q.id for q in self.radar.quadrants_raw.values()}
+
+    def make_index_entries(self):
+        quadrant_ids = self.quadrant_ids()
+        # descriptions are only rendered for the shards
+        return [dict(self.make_entry(blip, ""), shard=quadrant_ids[blip.quadrant]) for blip in self.radar.blips]
+
+    def make_shards(self):
+        quadrant_ids = self.quadrant_ids()
+        shards = {q_id: {} for q_id in quadrant_ids.values()}
         for blip in self.radar.blips:
-            results.append(
-                dict(
-                    name=blip.name,
-                    ring=blip.ring,
-                    quadrant=blip.quadrant,
-                    isNew="TRUE" if blip.is_new else "FALSE",
-                    description=blip.description,
-                )
-            )
+            shards[quadrant_ids[blip.quadrant]][blip.name] = self.description_html(blip)
+        return shards
+
+    def make_output(self):
+        if self.sharded:
+            return json.dumps(self.make_index_entries())
+        return json.dumps(self.make_entries())
+
+    @staticmethod
+    def shard_path(output: Path, shard: str) -> Path:
+        return output.with_name(f"{output.stem}.{shard}{output.suffix}")
+
+    def write(self, output: Path) -> None:
+        super().write(output)
+        written = [output]
+        if self.sharded:
+            for shard, descriptions in self.make_shards().items():
+                shard_output = self.shard_path(output, shard)
+                with open(shard_output, "w") as outputfile:
+                    outputfile.write(json.dumps(descriptions))
+                written.append(shard_output)
 
-        return json.dumps(results)
+        # the served document is precompressed too, so nginx can send it with gzip_static
+        if self.sharded or output == self.served_output:
+            for path in written:
+                write_precompressed(path)
+
+    def page_snippets(self):
+        snippets = []
+        if self.sharded:
+            # the upstream page only loads the index, the shards are fetched by this client
+            served = Path("/files") / self.run_output_file
+            snippets.append(shard_client_snippet % dict(index=served.as_posix(), prefix=f"{served.with_suffix('').as_posix()}.", suffix=served.suffix))
+        if self.live:
+            # the upstream page cannot redraw in place, so it is reloaded whenever the radar changes
+            snippets.append(self.live.reload_snippet())
+        return "".join(snippets)
 
     def run(self):
         with TemporaryDirectory(dir=".", prefix=".runradarrun-") as temp_dir:
             os.chmod(temp_dir, 0o755)
-            temp_output = Path(temp_dir) / self.run_output_file
+            files_dir = Path(temp_dir) / "files"
+            files_dir.mkdir(mode=0o755)
+            temp_output = files_dir / self.run_output_file
+            self.served_output = temp_output
             self.write(temp_output)
 
+            conf = Path(temp_dir) / "run-radar-run.conf"
+            snippet = self.page_snippets()
+            conf.write_text(nginx_conf + (nginx_snippet_conf % dict(snippet=snippet) if snippet else ""))
+            volumes = {
+                files_dir.as_posix(): {"bind": "/opt/build-your-own-radar/files", "mode": "rw"},
+                conf.as_posix(): {"bind": "/etc/nginx/conf.d/run-radar-run.conf", "mode": "ro"},
+            }
+
             rd = self.radar
-            client = docker.from_env()
-            self.container = client.containers.run(
+            self.container = self.backend.run_container(
                 self.container_image,
                 auto_remove=True,
                 ports={"80/tcp": 8080},
@@ -54,7 +175,7 @@ class Publisher(AbstractPublisher):
                     "QUADRANTS": json.dumps([q.name for q in rd.quadrants(rd.QUADRANTS_TL_BL_TR_BR)]),
                     "RINGS": json.dumps([r.name for r in rd.rings_outward()]),
                 },
-                volumes={temp_dir: {"bind": "/opt/build-your-own-radar/files", "mode": "rw"}},
+                volumes=volumes,
                 detach=True,
                 stream=True,
             )
@@ -62,7 +183,7 @@ class Publisher(AbstractPublisher):
             p = Printer(self.options.quiet)
 
             def trigger_browser(line):
-                if "Starting nginx server..." in line:
+                if self.ready_line in line:
                     self.open_url()
 
             p.logger(
@@ -70,6 +191,7 @@ class Publisher(AbstractPublisher):
                 log_height=10,
                 trigger=trigger_browser,
             )
+            self.served_output = None
 
     def cleanup(self):
         if self.container:
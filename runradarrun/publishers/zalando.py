@@ -6,9 +6,6 @@ import os
 from pathlib import Path
 from tempfile import TemporaryDirectory
 
-import docker
-from git import Repo
-
 from ..model import AbstractPublisher
 from ..output import Printer
 
@@ -36,12 +33,17 @@ html_content = """\
 fetch('./config.json').then(function(response) {
   return response.json();
 }).then(function(data) {
-  radar_visualization(data);
+  window.radarEntries = data.entries;
+  window.radarRender = function() {
+    d3.select('#radar').selectAll('*').remove();
+    radar_visualization(data);
+  };
+  window.radarRender();
 }).catch(function(err) {
   console.log('Error loading config.json', err);
 });
 </script>
-
+%(live_snippet)s
 </body>
 </html>
 """
@@ -53,6 +55,12 @@ class Publisher(AbstractPublisher):
     container = None
     publishing_url = "http://localhost:8080/"
     ring_colors = ["#5ba300", "#009eb0", "#c7ba00", "#e09b96"]
+    entry_key = "label"
+    ready_line = "Watching files..."
+    run_command = ["start", "--no-open"]
+    # browser-sync reloads the page on any change under docs, so with --live it must not
+    # watch config.json: changes reach the page as diffs instead
+    live_command = ["browser-sync", "start", "--server", "docs", "--files", "docs", "--ignore", "docs/config.json", "--no-open"]
 
     @property
     def quadrant_order(self):
@@ -63,11 +71,11 @@ class Publisher(AbstractPublisher):
     def cli_id(cls):
         return "zalando"
 
-    def make_output(self):
+    def make_entries(self):
         q_names = [q.name for q in self.radar.quadrants(self.quadrant_order)]
         r_names = [r.name for r in self.radar.rings_outward()]
 
-        entries = [
+        return [
             dict(
                 quadrant=q_names.index(blip.quadrant),
                 ring=r_names.index(blip.ring),
@@ -78,6 +86,7 @@ class Publisher(AbstractPublisher):
             for blip in self.radar.blips
         ]
 
+    def make_output(self):
         output = dict(
             repo_url="https://github.com/zalando/tech-radar",
             title="Zalando Tech Radar",
@@ -90,7 +99,7 @@ class Publisher(AbstractPublisher):
                 )
                 for r, c in zip(self.radar.rings_outward(), self.ring_colors)
             ],
-            entries=entries,
+            entries=self.make_entries(),
         )
         return json.dumps(output)
 
@@ -99,19 +108,20 @@ class Publisher(AbstractPublisher):
             os.chmod(temp_dir, 0o755)
 
             repo_dir = Path(temp_dir) / "zalando"
-            Repo.clone_from(self.zalando_git_url, repo_dir, depth=1)
+            self.backend.clone(self.zalando_git_url, repo_dir, depth=1)
 
             temp_output = repo_dir / "docs" / "config.json"
             self.write(temp_output)
+            self.served_output = temp_output
 
+            live_snippet = self.live.snippet(self.entry_key) if self.live else ""
             with open(repo_dir / "docs" / "index.html", "w") as index:
-                index.write(html_content)
+                index.write(html_content % dict(live_snippet=live_snippet))
 
             p = Printer(self.options.quiet)
 
-            client = docker.from_env()
             # Run bare yarn to install packages
-            self.container = client.containers.run(
+            self.container = self.backend.run_container(
                 self.container_image,
                 auto_remove=True,
                 volumes={repo_dir.as_posix(): {"bind": "/app", "mode": "rw"}},
@@ -127,7 +137,7 @@ class Publisher(AbstractPublisher):
             )
 
             # Run radar
-            self.container = client.containers.run(
+            self.container = self.backend.run_container(
                 self.container_image,
                 auto_remove=True,
                 ports={"3000/tcp": 8080},
@@ -135,12 +145,12 @@ class Publisher(AbstractPublisher):
                 working_dir="/app",
                 detach=True,
                 stream=True,
-                command=["start", "--no-open"],
+                command=self.live_command if self.live else self.run_command,
                 user=os.getuid(),
             )
 
             def trigger_browser(line):
-                if "Watching files..." in line:
+                if self.ready_line in line:
                     self.open_url()
 
             p.logger(
@@ -148,6 +158,7 @@ class Publisher(AbstractPublisher):
                 log_height=10,
                 trigger=trigger_browser,
             )
+            self.served_output = None
 
     def cleanup(self):
         if self.container:
@@ -0,0 +1,214 @@
+# -*- coding: utf-8 -*-
+# code: language=python tabSize=4
+#
+import hashlib
+import html
+import os
+import re
+from collections import OrderedDict
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from typing import List
+from urllib.parse import urlsplit
+
+# link targets may contain one level of balanced parentheses, as in CommonMark
+_target = r"(?:[^()\s]|\([^()\s]*\))+"
+_inline = re.compile(
+    r"`(?P<code>[^`]+)`"
+    rf"|!\[(?P<alt>[^\]]*)\]\((?P<src>{_target})\)"
+    rf"|\[(?P<text>(?:[^\[\]]|\[[^\]]*\])+)\]\((?P<href>{_target})\)"
+    r"|<(?P<autolink>(?:https?://|mailto:)[^>\s]+)>"
+    r"|(?P<url>https?://(?:[^\s<>()]|\([^\s<>()]*\))*(?:[^\s<>().,;:!?'\"]|\([^\s<>()]*\)))"
+    r"|\*\*\*(?P<strong_em>[^*]+?)\*\*\*"
+    r"|\*\*(?P<strong>.+?)\*\*|__(?P<strong2>.+?)__"
+    r"|\*(?![\s*])(?P<em>(?:\*\*[^*]+\*\*|[^*])+?)(?<!\s)\*|(?<!\w)_(?P<em2>[^_\s](?:.*?[^_\s])?)_(?!\w)"
+)
+_heading = re.compile(r"^(#{1,6})\s+(.*?)\s*#*\s*$")
+_bullet = re.compile(r"^\s{0,3}[-*+]\s+(.*)$")
+_ordered = re.compile(r"^\s{0,3}\d+[.)]\s+(.*)$")
+_quote = re.compile(r"^\s{0,3}>\s?(.*)$")
+_fence = re.compile(r"^\s{0,3}```")
+
+SAFE_URL_SCHEMES = ("", "http", "https", "mailto")
+
+
+def as_markdown(value: str | list[str] | None, bullets: bool = False) -> str:
+    if not value:
+        return ""
+    if isinstance(value, str):
+        return value
+    if bullets:
+        return "\n".join(f"- {item}" for item in value)
+    return "\n\n".join(value)
+
+
+def safe_url(url: str) -> str | None:
+    try:
+        scheme = urlsplit(url.strip()).scheme.lower()
+    except ValueError:
+        return None
+    return url if scheme in SAFE_URL_SCHEMES else None
+
+
+def _link(href: str, content: str) -> str:
+    url = safe_url(href)
+    if url is None:
+        return content
+    return f'<a href="{html.escape(url, quote=True)}">{content}</a>'
+
+
+def render_inline(text: str) -> str:
+    result = []
+    pos = 0
+    for match in _inline.finditer(text):
+        result.append(html.escape(text[pos : match.start()], quote=False))
+        pos = match.end()
+        group, value = next((k, v) for k, v in match.groupdict().items() if v is not None)
+        if group == "code":
+            result.append(f"<code>{html.escape(value, quote=False)}</code>")
+        elif group == "alt":
+            src = safe_url(match.group("src"))
+            alt = html.escape(value, quote=True)
+            result.append(alt if src is None else f'<img src="{html.escape(src, quote=True)}" alt="{alt}">')
+        elif group == "text":
+            result.append(_link(match.group("href"), render_inline(value)))
+        elif group in ("autolink", "url"):
+            result.append(_link(value, html.escape(value, quote=False)))
+        elif group == "strong_em":
+            result.append(f"<em><strong>{render_inline(value)}</strong></em>")
+        elif group in ("strong", "strong2"):
+            result.append(f"<strong>{render_inline(value)}</strong>")
+        else:
+            result.append(f"<em>{render_inline(value)}</em>")
+    result.append(html.escape(text[pos:], quote=False))
+    return "".join(result)
+
+
+def _list_kind(line: str) -> str | None:
+    if _bullet.match(line):
+        return "ul"
+    if _ordered.match(line):
+        return "ol"
+    return None
+
+
+def _list_block(lines: List[str], tag: str) -> str:
+    pattern = _bullet if tag == "ul" else _ordered
+    items: List[List[str]] = []
+    for line in lines:
+        match = pattern.match(line)
+        if match:
+            items.append([match.group(1)])
+        else:
+            items[-1].append(line.strip())
+    return f"<{tag}>" + "".join(f"<li>{render_inline(' '.join(item))}</li>" for item in items) + f"</{tag}>"
+
+
+def _split_lists(block: List[str]) -> List[tuple]:
+    # a list starts at every line with a marker of a different kind than the current
+    # list, other lines continue the current paragraph or list item
+    segments = []
+    for line in block:
+        kind = _list_kind(line)
+        if segments and (kind is None or kind == segments[-1][0]):
+            segments[-1][1].append(line)
+        else:
+            segments.append((kind, [line]))
+    return segments
+
+
+def render_markdown(text: str) -> str:
+    blocks = []
+    lines = text.replace("\r\n", "\n").split("\n")
+    i = 0
+    while i < len(lines):
+        line = lines[i]
+        if not line.strip():
+            i += 1
+        elif _fence.match(line):
+            end = i + 1
+            while end < len(lines) and not _fence.match(lines[end]):
+                end += 1
+            code = html.escape("\n".join(lines[i + 1 : end]), quote=False)
+            blocks.append(f"<pre><code>{code}</code></pre>")
+            i = end + 1
+        elif heading := _heading.match(line):
+            level = len(heading.group(1))
+            blocks.append(f"<h{level}>{render_inline(heading.group(2))}</h{level}>")
+            i += 1
+        else:
+            end = i + 1
+            while end < len(lines) and lines[end].strip() and not _fence.match(lines[end]) and not _heading.match(lines[end]):
+                end += 1
+            block = lines[i:end]
+            if all(_quote.match(b) for b in block):
+                quoted = "\n".join(_quote.match(b).group(1) for b in block)
+                blocks.append(f"<blockquote>{render_markdown(quoted)}</blockquote>")
+            else:
+                for kind, segment in _split_lists(block):
+                    if kind:
+                        blocks.append(_list_block(segment, kind))
+                    else:
+                        paragraph = "\n".join(b.strip() for b in segment)
+                        blocks.append(f"<p>{render_inline(paragraph)}</p>")
+            i = end
+    return "\n".join(blocks)
+
+
+def default_cache_dir() -> Path:
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "run-radar-run" / "descriptions"
+
+
+class Renderer:
+    # bump whenever render_markdown output changes, to invalidate disk caches
+    version = "3"
+
+    def __init__(self, cache_dir: Path | None = None, maxsize: int = 1024) -> None:
+        self.cache_dir = cache_dir
+        self.maxsize = maxsize
+        self._memo: OrderedDict[str, str] = OrderedDict()
+
+    def key(self, text: str) -> str:
+        return hashlib.sha256(f"{self.version}\0{text}".encode("utf-8")).hexdigest()
+
+    def _cache_path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.html"
+
+    def _load(self, key: str) -> str | None:
+        if self.cache_dir is None:
+            return None
+        try:
+            return self._cache_path(key).read_text(encoding="utf-8")
+        except (OSError, UnicodeDecodeError):
+            return None
+
+    def _store(self, key: str, rendered: str) -> None:
+        if self.cache_dir is None:
+            return
+        path = self._cache_path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with NamedTemporaryFile("w", encoding="utf-8", dir=path.parent, delete=False) as f:
+                f.write(rendered)
+            os.replace(f.name, path)
+        except OSError:
+            pass
+
+    def render(self, text: str) -> str:
+        if not text:
+            return ""
+        key = self.key(text)
+        if key in self._memo:
+            self._memo.move_to_end(key)
+            return self._memo[key]
+
+        rendered = self._load(key)
+        if rendered is None:
+            rendered = render_markdown(text)
+            self._store(key, rendered)
+
+        self._memo[key] = rendered
+        if len(self._memo) > self.maxsize:
+            self._memo.popitem(last=False)
+        return rendered
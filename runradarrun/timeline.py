@@ -0,0 +1,185 @@
+# -*- coding: utf-8 -*-
+# code: language=python tabSize=4
+#
+import argparse
+import json
+from datetime import datetime, timezone
+from pathlib import Path, PurePosixPath
+from typing import Dict, List, Set, Tuple
+
+import yaml
+from git import Commit, InvalidGitRepositoryError, NoSuchPathError, Repo
+from git.exc import BadName
+
+from .model import Radar, RadarException
+from .output import Printer
+
+SPECS_FILES = ("specs.yaml", "specs.yml")
+
+
+class Timeline:
+    def __init__(self, path: Path, revisions: List[str] | None = None, options: argparse.Namespace | None = None) -> None:
+        self.radar_path = path
+        self.options = options
+        self.printer = Printer(options.quiet if options else True)
+        try:
+            self.repo = Repo(path, search_parent_directories=True)
+        except (InvalidGitRepositoryError, NoSuchPathError):
+            raise RadarException(f"Radar path {path} is not inside a git repository")
+        relative = path.resolve().relative_to(Path(self.repo.working_tree_dir).resolve())
+        self.prefix = "" if relative == Path(".") else relative.as_posix()
+        self.revisions = revisions or [tag.name for tag in sorted(self.repo.tags, key=lambda t: t.commit.committed_date)]
+        if not self.revisions:
+            raise RadarException("No radar versions found, tag the repository or pass revisions explicitly")
+
+        # state of the radar at the version being processed
+        self.specs: Dict[str, dict] = {}
+        self.files: Dict[str, Tuple[str, str, str]] = {}
+        # every file defining a name, the last one added decides its placement
+        self.by_name: Dict[str, List[str]] = {}
+        self.placement: Dict[str, Tuple[str, str] | None] = {}
+
+        # accumulated output
+        self.versions: List[dict] = []
+        self.ring_ids: List[str] = []
+        self.quadrant_ids: List[str] = []
+        self.names: Dict[str, str] = {}
+        self.history: Dict[str, List[list]] = {}
+
+    def relative(self, repo_path: str) -> PurePosixPath | None:
+        if not self.prefix:
+            return PurePosixPath(repo_path)
+        path = PurePosixPath(repo_path)
+        try:
+            return path.relative_to(self.prefix)
+        except ValueError:
+            return None
+
+    def commit(self, revision: str) -> Commit:
+        try:
+            return self.repo.commit(revision)
+        except (BadName, ValueError):
+            raise RadarException(f"Unknown radar version: {revision}")
+
+    def load_specs(self, data: bytes) -> None:
+        specs = yaml.safe_load(data)
+        self.specs = dict(
+            rings={specs["rings"][p]["id"]: specs["rings"][p] for p in Radar.RINGS_OUTWARD if p in specs["rings"]},
+            quadrants={specs["quadrants"][p]["id"]: specs["quadrants"][p] for p in Radar.QUADRANTS_CLOCKWISE if p in specs["quadrants"]},
+        )
+        for kind, ids in (("rings", self.ring_ids), ("quadrants", self.quadrant_ids)):
+            for item in self.specs[kind].values():
+                if item["id"] not in ids:
+                    ids.append(item["id"])
+                self.names[f"{kind}/{item['id']}"] = item["name"]
+
+    def remove(self, path: str, touched: Set[str]) -> None:
+        if path in self.files:
+            name = self.files.pop(path)[2]
+            paths = self.by_name[name]
+            paths.remove(path)
+            if not paths:
+                del self.by_name[name]
+            touched.add(name)
+
+    def add(self, path: str, data: bytes, revision: str, touched: Set[str]) -> None:
+        self.remove(path, touched)
+        quadrant_id, ring_id, _ = PurePosixPath(path).parts
+        try:
+            name = yaml.safe_load(data)["blip"]["name"]
+        except (yaml.YAMLError, KeyError, TypeError) as e:
+            self.printer.print(f"{self.printer.term.bold_yellow}WARNING: skipping {revision}:{path}: {e}{self.printer.term.normal}")
+            return
+        self.files[path] = (quadrant_id, ring_id, name)
+        self.by_name.setdefault(name, []).append(path)
+        touched.add(name)
+
+    @staticmethod
+    def is_blip(path: PurePosixPath) -> bool:
+        return len(path.parts) == 3 and path.suffix in (".yaml", ".yml")
+
+    def apply_tree(self, commit: Commit, revision: str, touched: Set[str]) -> bool:
+        specs_changed = False
+        try:
+            tree = commit.tree / self.prefix if self.prefix else commit.tree
+        except KeyError:
+            raise RadarException(f"Radar version {revision} has no {self.prefix} directory")
+        for item in tree.traverse():
+            if item.type != "blob":
+                continue
+            path = self.relative(item.path)
+            if path.as_posix() in SPECS_FILES:
+                self.load_specs(item.data_stream.read())
+                specs_changed = True
+            elif self.is_blip(path):
+                self.add(path.as_posix(), item.data_stream.read(), revision, touched)
+        return specs_changed
+
+    def apply_diff(self, previous: Commit, commit: Commit, revision: str, touched: Set[str]) -> bool:
+        specs_changed = False
+        for diff in previous.diff(commit, paths=self.prefix or None):
+            old_path = self.relative(diff.a_path) if diff.a_path and diff.change_type != "A" else None
+            new_path = self.relative(diff.b_path) if diff.b_path and diff.change_type != "D" else None
+
+            if old_path is not None and self.is_blip(old_path):
+                self.remove(old_path.as_posix(), touched)
+            if new_path is None:
+                continue
+            if new_path.as_posix() in SPECS_FILES:
+                self.load_specs(diff.b_blob.data_stream.read())
+                specs_changed = True
+            elif self.is_blip(new_path):
+                self.add(new_path.as_posix(), diff.b_blob.data_stream.read(), revision, touched)
+        return specs_changed
+
+    def record(self, index: int, touched: Set[str]) -> None:
+        for name in touched:
+            paths = self.by_name.get(name)
+            placement = None
+            if paths:
+                quadrant_id, ring_id, _ = self.files[paths[-1]]
+                if quadrant_id in self.specs["quadrants"] and ring_id in self.specs["rings"]:
+                    placement = (quadrant_id, ring_id)
+
+            if placement == self.placement.get(name):
+                continue
+            self.placement[name] = placement
+            if placement is None:
+                self.history[name].append([index, None, None])
+            else:
+                event = [index, self.quadrant_ids.index(placement[0]), self.ring_ids.index(placement[1])]
+                self.history.setdefault(name, []).append(event)
+
+    def build(self) -> dict:
+        previous = None
+        for index, revision in enumerate(self.revisions):
+            commit = self.commit(revision)
+            touched: Set[str] = set()
+            if previous is None:
+                specs_changed = self.apply_tree(commit, revision, touched)
+            else:
+                specs_changed = self.apply_diff(previous, commit, revision, touched)
+            if not self.specs:
+                raise RadarException(f"Radar version {revision} has no specs file")
+            if specs_changed:
+                touched.update(self.placement, self.by_name)
+
+            self.record(index, touched)
+            self.versions.append(
+                dict(
+                    id=revision,
+                    date=datetime.fromtimestamp(commit.committed_date, timezone.utc).date().isoformat(),
+                )
+            )
+            previous = commit
+
+        return dict(
+            versions=self.versions,
+            quadrants=[self.names[f"quadrants/{q}"] for q in self.quadrant_ids],
+            rings=[self.names[f"rings/{r}"] for r in self.ring_ids],
+            blips=[dict(name=name, history=events) for name, events in sorted(self.history.items())],
+        )
+
+    def write(self, output: Path) -> None:
+        with open(output, "w") as outputfile:
+            json.dump(self.build(), outputfile, separators=(",", ":"))
@@ -0,0 +1,271 @@
+# -*- coding: utf-8 -*-
+# code: language=python tabSize=4
+#
+import argparse
+import json
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List
+
+import yaml
+
+from .ingest import Ingester
+from .model import Radar
+from .output import github_annotation
+
+Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+ERROR = "error"
+WARNING = "warning"
+
+
+def _is_str_or_list_of_str(value) -> bool:
+    return isinstance(value, str) or (isinstance(value, list) and all(isinstance(v, str) for v in value))
+
+
+TYPE_CHECKS: Dict[str, Callable[[object], bool]] = {
+    "a string": lambda value: isinstance(value, str),
+    "a boolean": lambda value: isinstance(value, bool),
+    "a string or a list of strings": _is_str_or_list_of_str,
+}
+
+BLIP_SCHEMA = {
+    "name": "a string",
+    "is_new": "a boolean",
+    "previous_ring": "a string",
+    "description": "a string or a list of strings",
+    "references": "a string or a list of strings",
+    "tags": "a string or a list of strings",
+}
+BLIP_REQUIRED = ("name",)
+
+# resolved once, so each blip check is a plain dict lookup per key
+COMPILED_BLIP_SCHEMA = {key: (kind, TYPE_CHECKS[kind]) for key, kind in BLIP_SCHEMA.items()}
+
+
+@dataclass
+class Diagnostic:
+    path: str
+    message: str
+    level: str = ERROR
+    line: int | None = None
+
+    def __str__(self) -> str:
+        location = f"{self.path}:{self.line}" if self.line else self.path
+        return f"{location}: {self.level}: {self.message}"
+
+
+@dataclass
+class BlipCheck:
+    path: str
+    name: str | None = None
+    line: int | None = None
+    diagnostics: List[Diagnostic] = field(default_factory=list)
+
+
+def _load(path: Path):
+    with open(path) as f:
+        loader = Loader(f)
+        try:
+            node = loader.get_single_node()
+            return node, loader.construct_document(node) if node is not None else None
+        finally:
+            loader.dispose()
+
+
+def _key_lines(node) -> Dict[str, int]:
+    if not isinstance(node, yaml.MappingNode):
+        return {}
+    return {k.value: k.start_mark.line + 1 for k, _ in node.value if isinstance(k, yaml.ScalarNode)}
+
+
+def _value_node(node, key: str):
+    if isinstance(node, yaml.MappingNode):
+        for k, v in node.value:
+            if isinstance(k, yaml.ScalarNode) and k.value == key:
+                return v
+    return None
+
+
+def check_blip_file(path: Path) -> BlipCheck:
+    result = BlipCheck(path=path.as_posix())
+
+    def report(message, level=ERROR, line=None):
+        result.diagnostics.append(Diagnostic(result.path, message, level, line))
+
+    try:
+        node, spec = _load(path)
+    except yaml.YAMLError as e:
+        mark = getattr(e, "problem_mark", None)
+        report(f"invalid YAML: {getattr(e, 'problem', None) or e}", line=mark.line + 1 if mark else None)
+        return result
+    except (OSError, UnicodeDecodeError) as e:
+        report(f"cannot read file: {e}")
+        return result
+
+    if not isinstance(spec, dict) or "blip" not in spec:
+        report("file must contain a 'blip' mapping")
+        return result
+
+    top_lines = _key_lines(node)
+    for key in spec:
+        if key != "blip":
+            report(f"unknown top-level key '{key}' is ignored", level=WARNING, line=top_lines.get(key))
+
+    blip = spec["blip"]
+    blip_node = _value_node(node, "blip")
+    if not isinstance(blip, dict):
+        report("'blip' must be a mapping", line=top_lines.get("blip"))
+        return result
+
+    lines = _key_lines(blip_node)
+    result.line = top_lines.get("blip")
+    for key in BLIP_REQUIRED:
+        if key not in blip:
+            report(f"missing required key '{key}'", line=result.line)
+
+    for key, value in blip.items():
+        if key not in COMPILED_BLIP_SCHEMA:
+            report(f"unknown key '{key}'", line=lines.get(key))
+            continue
+        kind, check = COMPILED_BLIP_SCHEMA[key]
+        if not check(value):
+            report(f"'{key}' must be {kind}", line=lines.get(key))
+
+    if isinstance(blip.get("name"), str):
+        result.name = blip["name"]
+        result.line = lines.get("name")
+    return result
+
+
+class Validator:
+    parallel_threshold = 64
+
+    def __init__(self, path: Path, options: argparse.Namespace | None = None) -> None:
+        self.radar_path = path
+        self.options = options
+        self.diagnostics: List[Diagnostic] = []
+
+    def report(self, path: Path, message: str, level: str = ERROR, line: int | None = None) -> None:
+        self.diagnostics.append(Diagnostic(path.as_posix(), message, level, line))
+
+    @property
+    def errors(self) -> List[Diagnostic]:
+        return [d for d in self.diagnostics if d.level == ERROR]
+
+    def check_specs(self, file: Path) -> tuple:
+        try:
+            node, specs = _load(file)
+        except FileNotFoundError:
+            self.report(file, "radar specs file not found")
+            return {}, {}
+        except yaml.YAMLError as e:
+            mark = getattr(e, "problem_mark", None)
+            self.report(file, f"invalid YAML: {getattr(e, 'problem', None) or e}", line=mark.line + 1 if mark else None)
+            return {}, {}
+        except (OSError, UnicodeDecodeError) as e:
+            self.report(file, f"cannot read file: {e}")
+            return {}, {}
+
+        if not isinstance(specs, dict):
+            self.report(file, "specs must be a mapping with 'rings' and 'quadrants'")
+            return {}, {}
+
+        lines = _key_lines(node)
+        rings = self._check_section(file, specs, "rings", Radar.RINGS_OUTWARD, lines.get("rings"), _value_node(node, "rings"))
+        quadrants = self._check_section(file, specs, "quadrants", Radar.QUADRANTS_CLOCKWISE, lines.get("quadrants"), _value_node(node, "quadrants"))
+
+        if rings and not Radar.MIN_NUM_RINGS <= len(rings) <= Radar.MAX_NUM_RINGS:
+            self.report(file, f"radar must have between {Radar.MIN_NUM_RINGS} and {Radar.MAX_NUM_RINGS} rings", line=lines.get("rings"))
+        if isinstance(specs.get("quadrants"), dict):
+            missing = [q for q in Radar.QUADRANTS_CLOCKWISE if q not in specs["quadrants"]]
+            if missing:
+                self.report(file, f"missing quadrants: {', '.join(missing)}", line=lines.get("quadrants"))
+
+        return rings, quadrants
+
+    def _check_section(self, file: Path, specs: dict, section: str, positions: tuple, line: int | None, node) -> Dict[str, dict]:
+        entries = specs.get(section)
+        if not isinstance(entries, dict):
+            self.report(file, f"'{section}' must be a mapping", line=line)
+            return {}
+
+        lines = _key_lines(node)
+        result = {}
+        for position, entry in entries.items():
+            if position not in positions:
+                self.report(file, f"unknown {section[:-1]} position '{position}', expected one of: {', '.join(positions)}", line=lines.get(position))
+            elif not isinstance(entry, dict) or not all(isinstance(entry.get(k), str) for k in ("id", "name")):
+                self.report(file, f"{section[:-1]} '{position}' must have string 'id' and 'name'", line=lines.get(position))
+            else:
+                result[position] = entry
+        return result
+
+    def collect(self, ring_ids: List[str], quadrant_ids: List[str]) -> List[Path]:
+        files = []
+        for quadrant_dir in sorted(self.radar_path.iterdir()):
+            if quadrant_dir.name.startswith(".") or not quadrant_dir.is_dir():
+                continue
+            if quadrant_dir.name not in quadrant_ids:
+                self.report(quadrant_dir, "stray directory, does not match any quadrant id", level=WARNING)
+                continue
+
+            for ring_dir in sorted(quadrant_dir.iterdir()):
+                if ring_dir.name.startswith("."):
+                    continue
+                if ring_dir.name not in ring_ids:
+                    self.report(ring_dir, "stray entry, does not match any ring id", level=WARNING)
+                    continue
+                if not ring_dir.is_dir():
+                    self.report(ring_dir, "must be a directory")
+                    continue
+
+                for path in sorted(ring_dir.iterdir()):
+                    if path.is_dir():
+                        self.report(path, "stray directory, blips must be placed directly in the ring directory", level=WARNING)
+                    elif path.name.endswith((".yaml", ".yml")):
+                        files.append(path)
+        return files
+
+    def check_blips(self, files: List[Path]) -> List[BlipCheck]:
+        if len(files) < self.parallel_threshold:
+            return [check_blip_file(path) for path in files]
+        with ProcessPoolExecutor() as executor:
+            return list(executor.map(check_blip_file, files, chunksize=32))
+
+    def check_duplicates(self, checks: List[BlipCheck]) -> None:
+        seen: Dict[str, BlipCheck] = {}
+        for check in checks:
+            if check.name is None:
+                continue
+            if check.name in seen:
+                first = seen[check.name]
+                self.diagnostics.append(Diagnostic(check.path, f"duplicate blip name '{check.name}', also defined in {first.path}", ERROR, check.line))
+            else:
+                seen[check.name] = check
+
+    def validate(self) -> List[Diagnostic]:
+        self.diagnostics = []
+        if not self.radar_path.is_dir():
+            self.report(self.radar_path, "radar path must be a directory")
+            return self.diagnostics
+
+        specs_file = Ingester(self.radar_path, options=self.options).specs_file
+        rings, quadrants = self.check_specs(specs_file)
+        files = self.collect([r["id"] for r in rings.values()], [q["id"] for q in quadrants.values()])
+
+        checks = self.check_blips(files)
+        for check in checks:
+            self.diagnostics.extend(check.diagnostics)
+        self.check_duplicates(checks)
+
+        return self.diagnostics
+
+
+def format_diagnostics(diagnostics: List[Diagnostic], fmt: str = "text") -> str:
+    if fmt == "json":
+        return json.dumps([asdict(d) for d in diagnostics])
+    if fmt == "github":
+        return "\n".join(github_annotation(d.level, d.message, file=d.path, line=d.line) for d in diagnostics)
+    return "\n".join(str(d) for d in diagnostics)
@@ -0,0 +1,27 @@
+import pytest
+
+from runradarrun.model import Quadrant, Radar, Ring
+
+
+@pytest.fixture
+def make_radar():
+    def make(*blips):
+        radar = Radar(
+            {
+                "inner": Ring(id="adopt", name="Adopt"),
+                "mid_inner": Ring(id="trial", name="Trial"),
+                "mid_outer": Ring(id="assess", name="Assess"),
+                "outer": Ring(id="hold", name="Hold"),
+            },
+            {
+                "top_left": Quadrant(id="strat", name="Strategies"),
+                "top_right": Quadrant(id="tools", name="Tools"),
+                "bottom_left": Quadrant(id="techniques", name="Techniques"),
+                "bottom_right": Quadrant(id="lang", name="Languages"),
+            },
+        )
+        for blip in blips:
+            radar.add_blip(blip)
+        return radar
+
+    return make
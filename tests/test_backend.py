@@ -0,0 +1,187 @@
+import argparse
+import json
+import math
+from pathlib import Path
+
+import pytest
+
+from runradarrun.backend import DEFAULT_RECORDINGS, Backend, FakeBackend, RecordingBackend, load_recordings
+from runradarrun.harness import measure
+from runradarrun.live import LiveServer
+from runradarrun.model import Blip
+from runradarrun.publishers import twbyor, zalando
+
+
+@pytest.fixture
+def radar(make_radar):
+    return make_radar(
+        Blip(name="Docker", ring="Adopt", quadrant="Tools"),
+    )
+
+
+@pytest.fixture
+def options():
+    return argparse.Namespace(quiet=True, run_only=False)
+
+
+@pytest.fixture(autouse=True)
+def workdir(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+class TestFakeBackend:
+    def test_replays_logs(self):
+        backend = FakeBackend(recordings={("image", ()): [(0, "one"), (0, "two")]}, speed=0)
+        container = backend.run_container("image", detach=True)
+        assert list(container.logs(stream=True)) == [b"one\n", b"two\n"]
+        assert [kind for _, kind, _ in backend.events] == ["run", "log", "log"]
+
+    def test_stop_ends_stream(self):
+        backend = FakeBackend(recordings={("image", ()): [(0, "one"), (0, "two")]}, speed=0)
+        container = backend.run_container("image")
+        logs = container.logs(stream=True)
+        next(logs)
+        container.stop()
+        assert list(logs) == []
+
+
+class TestRecordingBackend:
+    @pytest.fixture
+    def container(self, mocker):
+        container = mocker.Mock()
+        container.logs.return_value = iter([b"one\ntw", b"o\n", b"ready\n", b"never\n"])
+        mocker.patch.object(Backend, "run_container", return_value=container)
+        return container
+
+    def test_records_lines(self, container, tmp_path):
+        backend = RecordingBackend(stop_on="ready")
+        recorded = backend.run_container("image", command=["start"])
+        assert b"".join(recorded.logs(stream=True)) == b"one\ntwo\nready\n"
+        recorded.stop()
+        container.stop.assert_called_once_with()
+
+        backend.save(tmp_path / "recording.json")
+        loaded = load_recordings(tmp_path / "recording.json")
+        assert [line for _, line in loaded["recordings"][("image", ("start",))]] == ["one", "two", "ready"]
+        assert loaded["stop_delay"] >= 0
+
+    def test_replay(self, container, tmp_path):
+        backend = RecordingBackend()
+        list(backend.run_container("image").logs(stream=True))
+        backend.save(tmp_path / "recording.json")
+
+        fake = FakeBackend.from_file(tmp_path / "recording.json", speed=0)
+        assert list(fake.run_container("image").logs(stream=True)) == [b"one\n", b"two\n", b"ready\n", b"never\n"]
+
+    def test_bundled_sample(self):
+        assert ("wwwthoughtworks/build-your-own-radar:latest", ()) in load_recordings(DEFAULT_RECORDINGS)["recordings"]
+
+
+class TestPublisherRun:
+    def test_twbyor(self, radar, options):
+        backend = FakeBackend(speed=0)
+        publisher = twbyor.Publisher(radar, options=options, backend=backend)
+        served = {}
+
+        def run_container(image, **kwargs):
+            for volume, bind in kwargs["volumes"].items():
+                if bind["bind"].endswith("/files"):
+                    served.update(json.loads((Path(volume) / publisher.run_output_file).read_text())[0])
+                    served["gz"] = (Path(volume) / (publisher.run_output_file + ".gz")).exists()
+                else:
+                    served["conf"] = Path(volume).read_text()
+            return FakeBackend.run_container(backend, image, **kwargs)
+
+        backend.run_container = run_container
+        publisher.run()
+        publisher.cleanup()
+
+        assert served["name"] == "Docker"
+        assert served["gz"]
+        assert served["conf"] == "gzip_static on;\n"
+        assert backend.first("browser") is not None
+        assert backend.containers[0].stopped
+
+    def test_zalando(self, radar, options):
+        backend = FakeBackend(speed=0)
+        publisher = zalando.Publisher(radar, options=options, backend=backend)
+        publisher.run()
+        publisher.cleanup()
+
+        assert [kind for _, kind, _ in backend.events if kind != "log"] == ["clone", "run", "run", "browser", "stop"]
+        assert backend.containers[1].kwargs["command"] == ["start", "--no-open"]
+
+    def test_twbyor_live_reloads_page(self, radar, options):
+        backend = FakeBackend(speed=0)
+        publisher = twbyor.Publisher(radar, options=options, backend=backend)
+        publisher.live = LiveServer()
+        confs = []
+
+        def run_container(image, **kwargs):
+            confs.extend(Path(v).read_text() for v, bind in kwargs["volumes"].items() if bind["bind"].startswith("/etc/nginx/"))
+            return FakeBackend.run_container(backend, image, **kwargs)
+
+        backend.run_container = run_container
+        publisher.run()
+
+        (conf,) = confs
+        assert "sub_filter '</body>'" in conf
+        assert publisher.live.url in conf
+
+    def test_zalando_live_does_not_watch_config(self, radar, options):
+        backend = FakeBackend(speed=0)
+        publisher = zalando.Publisher(radar, options=options, backend=backend)
+        publisher.live = LiveServer()
+        publisher.run()
+
+        assert "docs/config.json" in backend.containers[1].kwargs["command"]
+        assert backend.first("browser") is not None
+
+    def test_twbyor_shard(self, radar):
+        backend = FakeBackend(speed=0)
+        publisher = twbyor.Publisher(radar, options=argparse.Namespace(quiet=True, run_only=False, shard=True), backend=backend)
+        publisher.live = LiveServer()
+        served = {}
+
+        def run_container(image, **kwargs):
+            for volume, bind in kwargs["volumes"].items():
+                if bind["bind"].endswith("/files"):
+                    served["files"] = sorted(path.name for path in Path(volume).iterdir())
+                else:
+                    served["conf"] = Path(volume).read_text()
+            return FakeBackend.run_container(backend, image, **kwargs)
+
+        backend.run_container = run_container
+        publisher.run()
+
+        assert "run-radar-run.tools.json" in served["files"]
+        assert "run-radar-run.tools.json.gz" in served["files"]
+        assert served["conf"].count("sub_filter '</body>'") == 1
+        assert "fetch('/files/run-radar-run.json')" in served["conf"]
+        assert "fetch('/files/run-radar-run.' + shard + '.json')" in served["conf"]
+        assert publisher.live.url in served["conf"]
+
+    def test_twbyor_snippets_are_nginx_safe(self, radar):
+        publisher = twbyor.Publisher(radar, options=argparse.Namespace(quiet=True, run_only=False, shard=True))
+        publisher.live = LiveServer()
+        assert not set('"$\\') & set(publisher.page_snippets())
+
+    def test_run_only_does_not_open_browser(self, radar):
+        backend = FakeBackend(speed=0)
+        twbyor.Publisher(radar, options=argparse.Namespace(quiet=True, run_only=True), backend=backend).run()
+        assert backend.first("browser") is None
+
+
+class TestMeasure:
+    @pytest.mark.parametrize("publisher_class", [twbyor.Publisher, zalando.Publisher])
+    def test_timings(self, radar, options, publisher_class):
+        timings = measure(publisher_class, radar, FakeBackend(speed=1000, stop_delay=0.01), options)
+        assert timings.publisher == publisher_class.cli_id()
+        assert 0 < timings.ready <= timings.browser
+        assert timings.cleanup >= 0.01 / 1000
+
+    def test_missing_ready_line(self, radar, options):
+        timings = measure(twbyor.Publisher, radar, FakeBackend(recordings={}, speed=0), options)
+        assert math.isnan(timings.ready)
+        assert math.isnan(timings.browser)
@@ -0,0 +1,118 @@
+import json
+import random
+from pathlib import Path
+
+import pytest
+
+from runradarrun.index import NameIndex, format_duplicates, name_key, normalize_name, trigrams
+from runradarrun.model import Blip
+
+
+def make_blip(name, source=None, quadrant="Tools", ring="Adopt"):
+    blip = Blip(name=name, ring=ring, quadrant=quadrant)
+    blip.source = Path(source) if source else None
+    return blip
+
+
+class TestNormalize:
+    def test_case_and_punctuation(self):
+        assert normalize_name("GitHub-Actions!") == "github actions"
+
+    def test_accents(self):
+        assert normalize_name("Café Señor") == "cafe senor"
+
+    def test_name_key_ignores_spaces(self):
+        assert name_key("Git Hub") == name_key("github")
+
+    def test_trigrams(self):
+        assert trigrams("ab") == {" ab", "ab "}
+
+
+class TestNameIndex:
+    def test_lookup_by_alias(self):
+        blip = make_blip("GitHub Actions (GHA)", "lang/trial/gha.yaml")
+        index = NameIndex([blip])
+        assert index.lookup("github actions") == [blip]
+        assert index.lookup("GHA") == [blip]
+
+    def test_exact_duplicates(self):
+        first = make_blip("Github Actions", "tools/adopt/github-actions.yaml")
+        second = make_blip("GitHub Actions (GHA)", "lang/trial/gha.yaml", quadrant="Languages")
+        (duplicate,) = NameIndex([first, second, make_blip("Docker")]).duplicates()
+        assert duplicate.score == 1.0
+        assert {duplicate.first.name, duplicate.second.name} == {first.name, second.name}
+
+    def test_abbreviation_matches_full_name(self):
+        first = make_blip("Kubernetes (K8s)")
+        second = make_blip("K8s", "tools/adopt/k8s.yaml")
+        (duplicate,) = NameIndex([first, second]).duplicates()
+        assert duplicate.score == 1.0
+
+    @pytest.mark.parametrize("names", [["Foo (beta)", "Bar (beta)"], ["Kubernetes (K8s)", "Nomad (K8s)"]])
+    def test_shared_qualifier(self, names):
+        assert NameIndex(make_blip(name) for name in names).duplicates() == []
+
+    def test_common_qualifier_is_not_an_abbreviation(self):
+        blips = [make_blip(f"Service{i} (AWS)") for i in range(50)] + [make_blip("AWS")]
+        assert NameIndex(blips).exact_pairs() == set()
+
+    def test_fuzzy_duplicates(self):
+        blips = [make_blip("Kubernetes Operator"), make_blip("Kubernetes Operators"), make_blip("Terraform")]
+        (duplicate,) = NameIndex(blips).duplicates(0.8)
+        assert 0.8 <= duplicate.score < 1.0
+        assert duplicate.first.name == "Kubernetes Operator"
+
+    def test_threshold(self):
+        blips = [make_blip("Kubernetes"), make_blip("Kubernets")]
+        assert NameIndex(blips).duplicates(0.8) == []
+        assert len(NameIndex(blips).duplicates(0.7)) == 1
+
+    @staticmethod
+    def random_names():
+        rng = random.Random(7)
+        words = ["".join(rng.choice("abcdefgh") for _ in range(rng.randint(1, 6))) for _ in range(60)]
+        return sorted({" ".join(rng.choice(words) for _ in range(rng.randint(1, 3))) for _ in range(400)})
+
+    @pytest.mark.parametrize("threshold", [0.3, 0.5, 0.7, 0.9, 1.0])
+    @pytest.mark.parametrize(
+        "names",
+        [
+            ["Docker", "Dockers", "Docker Compose", "Docker Swarm", "Podman", "Podman Compose", "Compose", "Kompose", "Swarm"],
+            ["a", "b", "ab", "a b", "abc", "abd", "Go", "Rust", "Rusty"],
+            random_names(),
+        ],
+        ids=["names", "tiny", "random"],
+    )
+    def test_matches_brute_force(self, threshold, names):
+        index = NameIndex(make_blip(name) for name in names)
+
+        expected = set()
+        for i, a in enumerate(names):
+            for j, b in enumerate(names[i + 1 :], i + 1):
+                ga, gb = trigrams(normalize_name(a)), trigrams(normalize_name(b))
+                if 2 * len(ga & gb) / (len(ga) + len(gb)) >= threshold:
+                    expected.add((i, j))
+
+        assert set(index.similar_pairs(threshold)) == expected
+
+
+class TestFormatDuplicates:
+    @pytest.fixture
+    def duplicates(self):
+        blips = [make_blip("Github Actions", "tools/adopt/a.yaml"), make_blip("GitHub Actions", "lang/trial/b.yaml")]
+        return NameIndex(blips).duplicates()
+
+    def test_text(self, duplicates):
+        assert format_duplicates(duplicates) == "1.00  Github Actions (tools/adopt/a.yaml)  ~  GitHub Actions (lang/trial/b.yaml)"
+
+    def test_json(self, duplicates):
+        (entry,) = json.loads(format_duplicates(duplicates, "json"))
+        assert entry["score"] == 1.0
+        assert entry["second"]["location"] == "lang/trial/b.yaml"
+
+    def test_github(self, duplicates):
+        assert format_duplicates(duplicates, "github").startswith("::warning file=lang/trial/b.yaml::")
+
+    def test_github_escapes_names(self):
+        blips = [make_blip("100% Go", "tools/adopt/a.yaml"), make_blip("100% Go", "lang/trial/b,c.yaml")]
+        assert format_duplicates(NameIndex(blips).duplicates(), "github").startswith("::warning file=lang/trial/b%2Cc.yaml::probable duplicate of '100%25 Go'")
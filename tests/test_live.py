@@ -0,0 +1,129 @@
+import json
+import time
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+import pytest
+
+from runradarrun.live import LiveServer, RadarWatcher, diff_entries, is_empty_diff
+from runradarrun.model import Blip
+from runradarrun.publishers import zalando
+from runradarrun.publishers.twbyor import Publisher
+
+
+class TestDiffEntries:
+    def test_no_changes(self):
+        entries = [{"name": "A", "ring": "Adopt"}]
+        diff = diff_entries(entries, list(entries), "name")
+        assert is_empty_diff(diff)
+
+    def test_added_removed_changed(self):
+        old = [{"name": "A", "ring": "Adopt"}, {"name": "B", "ring": "Trial"}]
+        new = [{"name": "A", "ring": "Hold"}, {"name": "C", "ring": "Trial"}]
+        diff = diff_entries(old, new, "name")
+        assert diff == dict(
+            added=[{"name": "C", "ring": "Trial"}],
+            removed=["B"],
+            changed=[{"name": "A", "ring": "Hold"}],
+        )
+
+
+class TestRefresh:
+    def test_refresh_rewrites_served_output(self, make_radar, tmp_path):
+        publisher = Publisher(make_radar(Blip(name="A", ring="Adopt", quadrant="Tools")))
+        publisher.served_output = tmp_path / "radar.json"
+
+        diff = publisher.refresh(make_radar(Blip(name="A", ring="Hold", quadrant="Tools")))
+
+        assert [e["ring"] for e in diff["changed"]] == ["Hold"]
+        assert json.loads(publisher.served_output.read_text())[0]["ring"] == "Hold"
+
+    def test_failed_refresh_keeps_publisher(self, make_radar, tmp_path):
+        radar = make_radar(Blip(name="A", ring="Adopt", quadrant="Tools"))
+        publisher = zalando.Publisher(radar)
+        publisher.served_output = tmp_path / "config.json"
+
+        with pytest.raises(ValueError):
+            publisher.refresh(make_radar(Blip(name="A", ring="Nowhere", quadrant="Tools")))
+
+        assert publisher.radar is radar
+        assert not publisher.served_output.exists()
+
+
+class TestRadarWatcher:
+    def test_poll_detects_changes(self, tmp_path):
+        calls = []
+        (tmp_path / "a.yaml").write_text("blip: {name: A}")
+        watcher = RadarWatcher(tmp_path, lambda: calls.append(True))
+
+        assert watcher.poll() is False
+        (tmp_path / "b.yaml").write_text("blip: {name: B}")
+        assert watcher.poll() is True
+        assert calls == [True]
+
+    def test_vanishing_file_is_skipped(self, tmp_path, mocker):
+        (tmp_path / "a.yaml").write_text("blip: {name: A}")
+        (tmp_path / ".a.yaml.swp").write_text("")
+        watcher = RadarWatcher(tmp_path, lambda: None)
+        stat = Path.stat
+
+        def flaky_stat(path, *args, **kwargs):
+            if path.name.endswith(".swp"):
+                raise FileNotFoundError(path)
+            return stat(path, *args, **kwargs)
+
+        mocker.patch.object(Path, "stat", flaky_stat)
+        assert list(watcher.snapshot()) == [(tmp_path / "a.yaml").as_posix()]
+
+    def test_loop_survives_errors(self, tmp_path):
+        errors = []
+        calls = []
+
+        def callback():
+            calls.append(True)
+            raise ValueError("boom")
+
+        watcher = RadarWatcher(tmp_path, callback, on_error=errors.append)
+        watcher.interval = 0.01
+        watcher.start()
+        try:
+            for count in (1, 2):
+                (tmp_path / f"{count}.yaml").write_text("blip: {name: A}")
+                deadline = time.monotonic() + 5
+                while len(calls) < count and time.monotonic() < deadline:
+                    time.sleep(0.01)
+        finally:
+            watcher.stop()
+
+        assert len(calls) == 2
+        assert [str(e) for e in errors] == ["boom", "boom"]
+
+
+class TestLiveServer:
+    @pytest.fixture
+    def live(self):
+        live = LiveServer()
+        live.port = 0
+        live.start()
+        live.port = live._server.server_address[1]
+        yield live
+        live.stop()
+
+    def test_publish_reaches_client(self, live):
+        with urllib.request.urlopen(live.url, timeout=5) as response:
+            assert response.headers["Content-Type"] == "text/event-stream"
+            assert response.headers["Access-Control-Allow-Origin"] == "http://localhost:8080"
+            live.publish(dict(added=[], removed=["A"], changed=[]))
+            assert response.readline() == b"event: diff\n"
+            assert json.loads(response.readline().decode("utf-8")[len("data: ") :])["removed"] == ["A"]
+
+    def test_unknown_path(self, live):
+        with pytest.raises(urllib.error.HTTPError):
+            urllib.request.urlopen(live.url.replace("/events", "/nope"), timeout=5)
+
+    def test_other_origin_refused(self, live):
+        request = urllib.request.Request(live.url, headers={"Origin": "https://evil.example"})
+        with pytest.raises(urllib.error.HTTPError) as e:
+            urllib.request.urlopen(request, timeout=5)
+        assert e.value.code == 403
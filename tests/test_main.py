@@ -0,0 +1,42 @@
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+import yaml
+
+from runradarrun.main import main
+
+SPECS_FILE = Path(__file__).parents[1] / "radar" / "specs.yaml"
+
+
+@pytest.fixture
+def radar_dir(tmp_path):
+    shutil.copy(SPECS_FILE, tmp_path / "specs.yaml")
+    for filename, name in (("gha.yaml", "GitHub Actions"), ("github-actions.yaml", "Github Actions (GHA)")):
+        blip_dir = tmp_path / "tools" / "adopt"
+        blip_dir.mkdir(parents=True, exist_ok=True)
+        (blip_dir / filename).write_text(yaml.dump({"blip": {"name": name}}))
+    return tmp_path
+
+
+def run_main(monkeypatch, *args):
+    monkeypatch.setattr(sys, "argv", ["run-radar-run", "-q", *map(str, args)])
+    return main()
+
+
+class TestDedupe:
+    def test_duplicates_found(self, radar_dir, monkeypatch, capsys):
+        assert run_main(monkeypatch, "--dedupe", radar_dir) == 0
+        assert "GitHub Actions" in capsys.readouterr().out
+
+    def test_fail_on_duplicates(self, radar_dir, monkeypatch):
+        assert run_main(monkeypatch, "--dedupe", "--fail-on-duplicates", radar_dir) == 1
+
+    def test_fail_on_duplicates_clean_radar(self, radar_dir, monkeypatch):
+        (radar_dir / "tools" / "adopt" / "gha.yaml").unlink()
+        assert run_main(monkeypatch, "--dedupe", "--fail-on-duplicates", radar_dir) == 0
+
+    def test_ingest_failure(self, radar_dir, monkeypatch):
+        (radar_dir / "tools" / "hold").write_text("not a directory")
+        assert run_main(monkeypatch, "--dedupe", radar_dir) == 1
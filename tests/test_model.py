@@ -1,3 +1,6 @@
+import subprocess
+import sys
+
 import pytest
 
 from runradarrun.model import Blip, Quadrant, Radar, RadarException, Ring
@@ -93,3 +96,11 @@ class TestRadar:
         radar = Radar(make_rings(), make_quadrants())
         names = [q.name for q in radar.quadrants(Radar.QUADRANTS_CLOCKWISE)]
         assert names == ["Strategies", "Tools", "Languages", "Techniques"]
+
+
+class TestImports:
+    def test_model_import_is_light(self):
+        # the validator and the timeline use the data model, and need neither docker nor the renderer
+        modules = ("docker", "git", "http.server", "runradarrun.render", "runradarrun.live", "runradarrun.backend")
+        code = f"import sys, runradarrun.model; print([m for m in {modules!r} if m in sys.modules])"
+        assert subprocess.check_output([sys.executable, "-c", code], text=True).strip() == "[]"
@@ -0,0 +1,140 @@
+import pytest
+
+from runradarrun.model import AbstractPublisher, Blip
+from runradarrun.render import Renderer, as_markdown, render_inline, render_markdown
+
+
+class TestAsMarkdown:
+    def test_empty(self):
+        assert as_markdown(None) == ""
+        assert as_markdown([]) == ""
+
+    def test_string(self):
+        assert as_markdown("text") == "text"
+
+    def test_list_as_paragraphs(self):
+        assert as_markdown(["a", "b"]) == "a\n\nb"
+
+    def test_list_as_bullets(self):
+        assert as_markdown(["a", "b"], bullets=True) == "- a\n- b"
+
+
+class TestRenderMarkdown:
+    def test_paragraphs(self):
+        assert render_markdown("one\n\ntwo") == "<p>one</p>\n<p>two</p>"
+
+    def test_emphasis_and_code(self):
+        assert render_inline("**bold** *em* `a < b`") == "<strong>bold</strong> <em>em</em> <code>a &lt; b</code>"
+
+    def test_underscores_inside_words(self):
+        assert render_inline("snake_case_name") == "snake_case_name"
+
+    def test_links(self):
+        assert render_inline("[docs](https://example.com/?a=1&b=2)") == '<a href="https://example.com/?a=1&amp;b=2">docs</a>'
+        assert render_inline("see https://example.com.") == 'see <a href="https://example.com">https://example.com</a>.'
+
+    def test_unsafe_link_dropped(self):
+        assert render_inline("[click](javascript:alert)") == "click"
+
+    def test_html_is_escaped(self):
+        assert render_markdown("<script>alert(1)</script>") == "<p>&lt;script&gt;alert(1)&lt;/script&gt;</p>"
+
+    def test_lists(self):
+        assert render_markdown("- a\n- b\n  more") == "<ul><li>a</li><li>b more</li></ul>"
+        assert render_markdown("1. a\n2. b") == "<ol><li>a</li><li>b</li></ol>"
+
+    def test_heading_quote_and_fence(self):
+        text = "## Title\n> quoted\n\n```\n<b>\n```"
+        assert render_markdown(text) == "<h2>Title</h2>\n<blockquote><p>quoted</p></blockquote>\n<pre><code>&lt;b&gt;</code></pre>"
+
+
+class TestSupportedSubset:
+    # pins the Markdown subset documented in the README
+
+    @pytest.mark.parametrize(
+        "text, expected",
+        [
+            ("*a **b** c*", "<em>a <strong>b</strong> c</em>"),
+            ("**a *b* c**", "<strong>a <em>b</em> c</strong>"),
+            ("***x***", "<em><strong>x</strong></em>"),
+            ("2 * 3 * 4", "2 * 3 * 4"),
+            ("![logo](https://a.example/l.png)", '<img src="https://a.example/l.png" alt="logo">'),
+            ("[![i](x.png)](https://a.example)", '<a href="https://a.example"><img src="x.png" alt="i"></a>'),
+            ("![x](javascript:alert)", "x"),
+            ("<https://a.example>", '<a href="https://a.example">https://a.example</a>'),
+            ("[a](https://w.example/Foo_(bar))", '<a href="https://w.example/Foo_(bar)">a</a>'),
+            ("![a](x_(1).png)", '<img src="x_(1).png" alt="a">'),
+            ("(see https://w.example/Foo_(bar))", '(see <a href="https://w.example/Foo_(bar)">https://w.example/Foo_(bar)</a>)'),
+            ("(https://a.example)", '(<a href="https://a.example">https://a.example</a>)'),
+        ],
+    )
+    def test_inline(self, text, expected):
+        assert render_inline(text) == expected
+
+    @pytest.mark.parametrize(
+        "text, expected",
+        [
+            ("1. x\n- y", "<ol><li>x</li></ol>\n<ul><li>y</li></ul>"),
+            ("Intro:\n- a\n- b", "<p>Intro:</p>\n<ul><li>a</li><li>b</li></ul>"),
+            ("# One\n###### Six", "<h1>One</h1>\n<h6>Six</h6>"),
+            ("> a\n> - b", "<blockquote><p>a</p>\n<ul><li>b</li></ul></blockquote>"),
+        ],
+    )
+    def test_blocks(self, text, expected):
+        assert render_markdown(text) == expected
+
+    @pytest.mark.parametrize(
+        "text, expected",
+        [
+            ("- a\n  - b", "<ul><li>a</li><li>b</li></ul>"),
+            ("[a][1]", "<p>[a][1]</p>"),
+            ("| a | b |", "<p>| a | b |</p>"),
+            ("a  \nb", "<p>a\nb</p>"),
+            ("<b>x</b>", "<p>&lt;b&gt;x&lt;/b&gt;</p>"),
+        ],
+        ids=["nested-list-flattened", "reference-link", "table", "hard-break", "raw-html"],
+    )
+    def test_unsupported_is_literal(self, text, expected):
+        assert render_markdown(text) == expected
+
+
+class TestRenderer:
+    def test_memoized_in_process(self, mocker):
+        spy = mocker.patch("runradarrun.render.render_markdown", return_value="<p>x</p>")
+        renderer = Renderer()
+        assert renderer.render("x") == renderer.render("x") == "<p>x</p>"
+        spy.assert_called_once_with("x")
+
+    def test_lru_eviction(self):
+        renderer = Renderer(maxsize=2)
+        for text in ("a", "b", "c"):
+            renderer.render(text)
+        assert len(renderer._memo) == 2
+        assert renderer.key("a") not in renderer._memo
+
+    def test_disk_cache(self, tmp_path, mocker):
+        Renderer(cache_dir=tmp_path).render("*x*")
+        assert len(list(tmp_path.rglob("*.html"))) == 1
+
+        spy = mocker.patch("runradarrun.render.render_markdown")
+        assert Renderer(cache_dir=tmp_path).render("*x*") == "<p><em>x</em></p>"
+        spy.assert_not_called()
+
+    def test_version_changes_key(self):
+        renderer = Renderer()
+        key = renderer.key("x")
+        renderer.version = "other"
+        assert renderer.key("x") != key
+
+
+class TestDescriptionHtml:
+    @pytest.fixture
+    def publisher(self):
+        return AbstractPublisher(radar=None)
+
+    def test_description_and_references(self, publisher):
+        blip = Blip(name="X", ring="Adopt", quadrant="Tools", description=["one", "two"], references=["https://a.example"])
+        assert publisher.description_html(blip) == '<p>one</p>\n<p>two</p>\n<ul><li><a href="https://a.example">https://a.example</a></li></ul>'
+
+    def test_empty(self, publisher):
+        assert publisher.description_html(Blip(name="X", ring="Adopt", quadrant="Tools")) == ""
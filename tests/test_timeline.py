@@ -0,0 +1,143 @@
+import argparse
+import json
+
+import pytest
+import yaml
+from git import Actor, Repo
+
+from runradarrun.model import RadarException
+from runradarrun.timeline import Timeline
+
+SPECS = {
+    "rings": {
+        "inner": {"id": "adopt", "name": "Adopt"},
+        "mid_inner": {"id": "trial", "name": "Trial"},
+        "outer": {"id": "hold", "name": "Hold"},
+    },
+    "quadrants": {
+        "top_left": {"id": "strat", "name": "Strategies"},
+        "top_right": {"id": "tools", "name": "Tools"},
+        "bottom_left": {"id": "techniques", "name": "Techniques"},
+        "bottom_right": {"id": "lang", "name": "Languages"},
+    },
+}
+
+AUTHOR = Actor("Radar", "radar@example.com")
+
+
+@pytest.fixture
+def options():
+    return argparse.Namespace(quiet=True)
+
+
+@pytest.fixture
+def repo(tmp_path):
+    return Repo.init(tmp_path)
+
+
+@pytest.fixture
+def radar_dir(repo, tmp_path):
+    radar_dir = tmp_path / "radar"
+    radar_dir.mkdir()
+    (radar_dir / "specs.yaml").write_text(yaml.dump(SPECS))
+    return radar_dir
+
+
+def write_blip(radar_dir, quadrant, ring, filename, name):
+    blip_dir = radar_dir / quadrant / ring
+    blip_dir.mkdir(parents=True, exist_ok=True)
+    (blip_dir / filename).write_text(yaml.dump({"blip": {"name": name}}))
+
+
+def move_blip(radar_dir, source, target):
+    (radar_dir / target).parent.mkdir(parents=True, exist_ok=True)
+    (radar_dir / source).rename(radar_dir / target)
+
+
+def release(repo, tag):
+    repo.git.add(A=True)
+    repo.index.commit(tag, author=AUTHOR, committer=AUTHOR)
+    repo.create_tag(tag)
+
+
+@pytest.fixture
+def history(repo, radar_dir):
+    write_blip(radar_dir, "tools", "hold", "docker.yaml", "Docker")
+    write_blip(radar_dir, "tools", "adopt", "make.yaml", "Make")
+    release(repo, "v1")
+
+    move_blip(radar_dir, "tools/hold/docker.yaml", "tools/trial/docker.yaml")
+    write_blip(radar_dir, "lang", "trial", "python.yaml", "Python")
+    release(repo, "v2")
+
+    (radar_dir / "tools" / "adopt" / "make.yaml").unlink()
+    move_blip(radar_dir, "tools/trial/docker.yaml", "tools/adopt/docker.yaml")
+    (radar_dir / "README.md").write_text("not a blip")
+    release(repo, "v3")
+
+    return radar_dir
+
+
+class TestTimeline:
+    def test_build(self, history, options):
+        timeline = Timeline(history, options=options).build()
+
+        assert [v["id"] for v in timeline["versions"]] == ["v1", "v2", "v3"]
+        assert timeline["rings"] == ["Adopt", "Trial", "Hold"]
+        assert timeline["quadrants"] == ["Strategies", "Tools", "Languages", "Techniques"]
+        assert timeline["blips"] == [
+            {"name": "Docker", "history": [[0, 1, 2], [1, 1, 1], [2, 1, 0]]},
+            {"name": "Make", "history": [[0, 1, 0], [2, None, None]]},
+            {"name": "Python", "history": [[1, 2, 1]]},
+        ]
+
+    def test_only_first_version_is_read_in_full(self, history, options, mocker):
+        apply_tree = mocker.spy(Timeline, "apply_tree")
+        apply_diff = mocker.spy(Timeline, "apply_diff")
+        Timeline(history, options=options).build()
+        assert apply_tree.call_count == 1
+        assert apply_diff.call_count == 2
+
+    def test_explicit_revisions(self, history, options):
+        timeline = Timeline(history, revisions=["v1", "v3"], options=options).build()
+        assert {b["name"]: b["history"] for b in timeline["blips"]}["Docker"] == [[0, 1, 2], [1, 1, 0]]
+
+    def test_specs_change_renames_rings(self, repo, radar_dir, options):
+        write_blip(radar_dir, "tools", "hold", "docker.yaml", "Docker")
+        release(repo, "v1")
+        specs = yaml.safe_load(yaml.dump(SPECS))
+        specs["rings"]["outer"]["name"] = "Avoid"
+        (radar_dir / "specs.yaml").write_text(yaml.dump(specs))
+        release(repo, "v2")
+
+        timeline = Timeline(radar_dir, options=options).build()
+        assert timeline["rings"] == ["Adopt", "Trial", "Avoid"]
+        assert timeline["blips"] == [{"name": "Docker", "history": [[0, 1, 2]]}]
+
+    def test_name_defined_twice(self, repo, radar_dir, options):
+        write_blip(radar_dir, "tools", "hold", "docker.yaml", "Docker")
+        release(repo, "v1")
+        write_blip(radar_dir, "tools", "adopt", "docker-copy.yaml", "Docker")
+        release(repo, "v2")
+        (radar_dir / "tools" / "adopt" / "docker-copy.yaml").unlink()
+        release(repo, "v3")
+
+        timeline = Timeline(radar_dir, options=options).build()
+        assert timeline["blips"] == [{"name": "Docker", "history": [[0, 1, 2], [1, 1, 0], [2, 1, 2]]}]
+
+    def test_write(self, history, options, tmp_path):
+        output = tmp_path / "timeline.json"
+        Timeline(history, options=options).write(output)
+        assert len(json.loads(output.read_text())["versions"]) == 3
+
+    def test_no_versions(self, repo, radar_dir, options):
+        with pytest.raises(RadarException):
+            Timeline(radar_dir, options=options)
+
+    def test_unknown_revision(self, history, options):
+        with pytest.raises(RadarException):
+            Timeline(history, revisions=["nope"], options=options).build()
+
+    def test_not_a_repository(self, tmp_path, options):
+        with pytest.raises(RadarException):
+            Timeline(tmp_path / "missing", options=options)
@@ -0,0 +1,60 @@
+import argparse
+import gzip
+import json
+
+import pytest
+
+from runradarrun.model import Blip
+from runradarrun.publishers.twbyor import Publisher
+
+
+@pytest.fixture
+def radar(make_radar):
+    return make_radar(
+        Blip(name="Docker", ring="Adopt", quadrant="Tools", description="Containers"),
+        Blip(name="Python", ring="Trial", quadrant="Languages", previous_ring="Trial", description="*Snakes*"),
+    )
+
+
+class TestOutput:
+    def test_flat(self, radar):
+        entries = json.loads(Publisher(radar, options=argparse.Namespace(shard=False)).output)
+        assert entries[0] == dict(name="Docker", ring="Adopt", quadrant="Tools", isNew="TRUE", description="<p>Containers</p>")
+
+    def test_index(self, radar):
+        entries = json.loads(Publisher(radar, options=argparse.Namespace(shard=True)).output)
+        assert entries[1] == dict(name="Python", ring="Trial", quadrant="Languages", isNew="FALSE", description="", shard="lang")
+
+
+class TestShardedWrite:
+    @pytest.fixture
+    def output(self, radar, tmp_path):
+        output = tmp_path / "radar.json"
+        Publisher(radar, options=argparse.Namespace(shard=True)).write(output)
+        return output
+
+    def test_shards(self, output):
+        assert json.loads((output.parent / "radar.tools.json").read_text()) == {"Docker": "<p>Containers</p>"}
+        assert json.loads((output.parent / "radar.lang.json").read_text()) == {"Python": "<p><em>Snakes</em></p>"}
+        assert json.loads((output.parent / "radar.strat.json").read_text()) == {}
+
+    def test_descriptions_rendered_once(self, radar, tmp_path, mocker):
+        publisher = Publisher(radar, options=argparse.Namespace(shard=True))
+        description_html = mocker.spy(publisher, "description_html")
+        publisher.write(tmp_path / "radar.json")
+        assert description_html.call_count == len(radar.blips)
+
+    def test_precompressed(self, output):
+        for path in output.parent.glob("*.json"):
+            assert gzip.decompress((path.parent / (path.name + ".gz")).read_bytes()) == path.read_bytes()
+
+    def test_served_output_is_precompressed(self, radar, tmp_path):
+        publisher = Publisher(radar, options=argparse.Namespace(shard=False))
+        publisher.served_output = tmp_path / "radar.json"
+        publisher.write(publisher.served_output)
+        publisher.refresh(radar)
+        assert gzip.decompress((tmp_path / "radar.json.gz").read_bytes()) == publisher.served_output.read_bytes()
+
+    def test_unsharded_writes_single_file(self, radar, tmp_path):
+        Publisher(radar, options=argparse.Namespace(shard=False)).write(tmp_path / "radar.json")
+        assert [p.name for p in tmp_path.iterdir()] == ["radar.json"]
@@ -0,0 +1,161 @@
+import argparse
+import json
+
+import pytest
+import yaml
+
+from runradarrun.validate import ERROR, WARNING, Diagnostic, Validator, check_blip_file, format_diagnostics
+
+SPECS = {
+    "rings": {
+        "inner": {"id": "adopt", "name": "Adopt"},
+        "mid_inner": {"id": "trial", "name": "Trial"},
+        "mid_outer": {"id": "assess", "name": "Assess"},
+        "outer": {"id": "hold", "name": "Hold"},
+    },
+    "quadrants": {
+        "top_left": {"id": "strat", "name": "Strategies"},
+        "top_right": {"id": "tools", "name": "Tools"},
+        "bottom_left": {"id": "techniques", "name": "Techniques"},
+        "bottom_right": {"id": "lang", "name": "Languages"},
+    },
+}
+
+
+@pytest.fixture
+def options():
+    return argparse.Namespace(quiet=True)
+
+
+@pytest.fixture
+def radar_dir(tmp_path):
+    (tmp_path / "specs.yaml").write_text(yaml.dump(SPECS))
+    return tmp_path
+
+
+def add_blip(radar_dir, quadrant, ring, filename, content):
+    blip_dir = radar_dir / quadrant / ring
+    blip_dir.mkdir(parents=True, exist_ok=True)
+    path = blip_dir / filename
+    path.write_text(content if isinstance(content, str) else yaml.dump(content))
+    return path
+
+
+class TestCheckBlipFile:
+    def test_valid(self, tmp_path):
+        path = tmp_path / "docker.yaml"
+        path.write_text(yaml.dump({"blip": {"name": "Docker", "is_new": True, "description": ["a", "b"]}}))
+        check = check_blip_file(path)
+        assert check.name == "Docker"
+        assert check.diagnostics == []
+
+    def test_missing_name_and_unknown_key(self, tmp_path):
+        path = tmp_path / "bad.yaml"
+        path.write_text("blip:\n  nme: Docker\n")
+        messages = [d.message for d in check_blip_file(path).diagnostics]
+        assert "missing required key 'name'" in messages
+        assert "unknown key 'nme'" in messages
+
+    def test_wrong_type_reports_line(self, tmp_path):
+        path = tmp_path / "bad.yaml"
+        path.write_text("blip:\n  name: Docker\n  is_new: maybe\n")
+        (diagnostic,) = check_blip_file(path).diagnostics
+        assert diagnostic.message == "'is_new' must be a boolean"
+        assert diagnostic.line == 3
+
+    def test_invalid_yaml(self, tmp_path):
+        path = tmp_path / "broken.yaml"
+        path.write_text("blip:\n  name: [Docker\n")
+        (diagnostic,) = check_blip_file(path).diagnostics
+        assert diagnostic.message.startswith("invalid YAML")
+        assert diagnostic.line is not None
+
+    def test_unknown_top_level_key_is_warning(self, tmp_path):
+        path = tmp_path / "extra.yaml"
+        path.write_text(yaml.dump({"blip": {"name": "Docker"}, "notes": "x"}))
+        (diagnostic,) = check_blip_file(path).diagnostics
+        assert diagnostic.level == WARNING
+
+
+class TestValidator:
+    def test_valid_radar(self, radar_dir, options):
+        add_blip(radar_dir, "tools", "adopt", "docker.yaml", {"blip": {"name": "Docker"}})
+        assert Validator(radar_dir, options=options).validate() == []
+
+    def test_reports_all_problems(self, radar_dir, options):
+        add_blip(radar_dir, "tools", "adopt", "a.yaml", "blip:\n  nme: A\n")
+        add_blip(radar_dir, "lang", "trial", "b.yaml", "blip: [\n")
+        add_blip(radar_dir, "strat", "hold", "c.yaml", {"blip": {"name": "C", "tags": 3}})
+
+        validator = Validator(radar_dir, options=options)
+        diagnostics = validator.validate()
+
+        assert {d.path.rsplit("/", 1)[-1] for d in validator.errors} == {"a.yaml", "b.yaml", "c.yaml"}
+        assert len(diagnostics) == 4
+
+    def test_duplicates_across_quadrants(self, radar_dir, options):
+        add_blip(radar_dir, "tools", "adopt", "docker.yaml", {"blip": {"name": "Docker"}})
+        add_blip(radar_dir, "lang", "hold", "docker.yaml", {"blip": {"name": "Docker"}})
+
+        (diagnostic,) = Validator(radar_dir, options=options).validate()
+        assert diagnostic.message.startswith("duplicate blip name 'Docker'")
+
+    def test_stray_directories(self, radar_dir, options):
+        (radar_dir / "toolz").mkdir()
+        (radar_dir / "tools" / "maybe").mkdir(parents=True)
+        (radar_dir / "tools" / "adopt" / "nested").mkdir(parents=True)
+
+        diagnostics = Validator(radar_dir, options=options).validate()
+        assert len(diagnostics) == 3
+        assert all(d.level == WARNING for d in diagnostics)
+
+    def test_unknown_ring_position(self, tmp_path, options):
+        specs = yaml.safe_load(yaml.dump(SPECS))
+        specs["rings"]["middle"] = specs["rings"].pop("mid_outer")
+        (tmp_path / "specs.yaml").write_text(yaml.dump(specs))
+
+        (diagnostic,) = Validator(tmp_path, options=options).validate()
+        assert diagnostic.level == ERROR
+        assert "unknown ring position 'middle'" in diagnostic.message
+
+    def test_missing_specs(self, tmp_path, options):
+        (diagnostic,) = Validator(tmp_path, options=options).validate()
+        assert diagnostic.message == "radar specs file not found"
+
+    def test_unreadable_specs(self, tmp_path, options):
+        (tmp_path / "specs.yaml").mkdir()
+        validator = Validator(tmp_path, options=options)
+        validator.validate()
+        (diagnostic,) = validator.errors
+        assert diagnostic.message.startswith("cannot read file:")
+
+    def test_parallel_pass(self, radar_dir, options):
+        for i in range(10):
+            add_blip(radar_dir, "tools", "adopt", f"b{i}.yaml", {"blip": {"name": f"B{i}", "bogus": 1}})
+        validator = Validator(radar_dir, options=options)
+        validator.parallel_threshold = 1
+        assert len(validator.validate()) == 10
+
+
+class TestFormatDiagnostics:
+    @pytest.fixture
+    def diagnostics(self, radar_dir, options):
+        add_blip(radar_dir, "tools", "adopt", "a.yaml", "blip:\n  name: A\n  bogus: 1\n")
+        return Validator(radar_dir, options=options).validate()
+
+    def test_text(self, diagnostics):
+        assert format_diagnostics(diagnostics).endswith("a.yaml:3: error: unknown key 'bogus'")
+
+    def test_github(self, diagnostics):
+        line = format_diagnostics(diagnostics, "github")
+        assert line.startswith("::error file=")
+        assert line.endswith("a.yaml,line=3::unknown key 'bogus'")
+
+    def test_github_escapes(self):
+        diagnostic = Diagnostic("a,b:c%.yaml", "invalid YAML: 100%\r\n  in line 2", line=2)
+        assert format_diagnostics([diagnostic], "github") == "::error file=a%2Cb%3Ac%25.yaml,line=2::invalid YAML: 100%25%0D%0A  in line 2"
+
+    def test_json(self, diagnostics):
+        (entry,) = json.loads(format_diagnostics(diagnostics, "json"))
+        assert entry["line"] == 3
+        assert entry["level"] == "error"